@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+async_solver.py – asyncio front end that keeps searches off the event loop
+
+``AsyncCalendarSolver`` owns a process pool of FastCalendarPuzzleSolver
+workers and exposes
+
+    await solver.solve_for_date_async(day, month, weekday)
+    async for board in solver.iter_solutions_async(day, month, weekday): ...
+
+Workers stream boards back through one result queue as they find them; a
+reader thread hands them to the event loop.  Concurrent requests for the
+same date (and the same call) share one in-flight search: late callers
+first receive the boards found so far, then follow the live stream.
+
+Cancelling a caller's task (or leaving an ``async for`` early) unsubscribes
+it; when the last subscriber of a search is gone the search is cancelled –
+a queued job never starts, a running one sees its cancel flag (one shared
+byte per request slot) at the next search node and stops.  A job that dies
+with its worker, or cannot be submitted, ends its stream with the error.  ``max_requests``
+bounds the searches in flight; further requests wait for a free slot.
+
+Usage:
+    async with AsyncCalendarSolver(jobs=4) as solver:
+        boards = await solver.solve_for_date_async(15, 3, 5)
+        async for board in solver.iter_solutions_async(25, 12, 3):
+            ...
+"""
+
+from __future__ import annotations
+import asyncio
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fast_dp_solver import FastCalendarPuzzleSolver, SearchCancelled
+
+Date = Tuple[int, int, int]          # (day, month, weekday)
+Board = List[List[int]]
+
+_END = object()                      # end of a run's stream, per subscriber queue
+
+# ─────────────────────────────  worker side  ─────────────────────────────
+_worker_solver: Any = None
+_cancel_flags: Any = None
+_result_queue: Any = None
+
+
+def _init_async_worker(solver_kwargs: Dict[str, Any], cancel_flags: Any, result_queue: Any) -> None:
+    global _worker_solver, _cancel_flags, _result_queue
+    _worker_solver = FastCalendarPuzzleSolver(**solver_kwargs)
+    _cancel_flags = cancel_flags
+    _result_queue = result_queue
+
+
+def _stream_date(request_id: int, slot: int, date: Date, limit: Optional[int]) -> None:
+    """Put (request_id, "board", board) per tiling, then (request_id, "end")."""
+    # polled at every search node, so a cancelled request stops mid-search
+    _worker_solver.cancel_check = lambda: _cancel_flags[slot] != 0
+    try:
+        for count, board in enumerate(_worker_solver.iter_solutions(*date), 1):
+            _result_queue.put((request_id, "board", board))
+            if limit is not None and count >= limit:
+                break
+    except SearchCancelled:
+        pass
+    except Exception as exc:
+        _result_queue.put((request_id, "error", exc))
+    finally:
+        _worker_solver.cancel_check = None
+        _result_queue.put((request_id, "end", None))
+
+
+# ─────────────────────────────  event-loop side  ─────────────────────────
+class _Run:
+    """One search in flight, shared by every subscriber asking for it."""
+
+    def __init__(self, key: Tuple[str, Date], request_id: int, limit: Optional[int]) -> None:
+        self.key = key
+        self.request_id = request_id
+        self.limit = limit
+        self.boards: List[Board] = []
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self.subscribers: List[asyncio.Queue] = []
+        self.slot: Optional[int] = None
+        self.start_task: Optional[asyncio.Task] = None
+        self.job: Optional[Future] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        for board in self.boards:
+            queue.put_nowait(board)
+        if self.done:
+            queue.put_nowait(_END)
+        self.subscribers.append(queue)
+        return queue
+
+    def publish(self, board: Board) -> None:
+        self.boards.append(board)
+        for queue in self.subscribers:
+            queue.put_nowait(board)
+
+    def finish(self) -> None:
+        self.done = True
+        for queue in self.subscribers:
+            queue.put_nowait(_END)
+
+
+class AsyncCalendarSolver:
+    """Process-pool backed async solver; use one instance per event loop."""
+
+    def __init__(self, jobs: Optional[int] = None, max_requests: int = 64,
+                 solver_kwargs: Optional[Dict[str, Any]] = None) -> None:
+        self.jobs = jobs
+        self.max_requests = max_requests
+        self.solver_kwargs = dict(solver_kwargs or {})
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runs: Dict[Tuple[str, Date], _Run] = {}      # in flight, by request key
+        self._by_id: Dict[int, _Run] = {}
+        self._ids = itertools.count()
+
+    # ─────────────────────────────  lifetime  ─────────────────────────────
+    def _start(self) -> None:
+        if self._pool is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._cancel_flags = multiprocessing.RawArray("b", self.max_requests)
+        self._results = multiprocessing.Queue()
+        self._free_slots: asyncio.Queue = asyncio.Queue()
+        for slot in range(self.max_requests):
+            self._free_slots.put_nowait(slot)
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=_init_async_worker,
+            initargs=(self.solver_kwargs, self._cancel_flags, self._results))
+        self._reader = threading.Thread(target=self._read_results, daemon=True)
+        self._reader.start()
+
+    async def close(self) -> None:
+        """Cancel every search, stop the workers and the reader thread."""
+        if self._pool is None:
+            return
+        for run in list(self._runs.values()):
+            self._cancel(run)
+        pool, self._pool = self._pool, None
+        await self._loop.run_in_executor(None, pool.shutdown)
+        self._results.put(None)
+        await self._loop.run_in_executor(None, self._reader.join)
+
+    async def __aenter__(self) -> "AsyncCalendarSolver":
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    # ───────────────────────────  result stream  ──────────────────────────
+    def _read_results(self) -> None:
+        while True:
+            message = self._results.get()
+            if message is None:
+                return
+            self._loop.call_soon_threadsafe(self._deliver, *message)
+
+    def _deliver(self, request_id: int, kind: str, payload: Any) -> None:
+        run = self._by_id.get(request_id)
+        if run is None:                  # cancelled; the worker's tail is dropped
+            return
+        if kind == "board":
+            run.publish(payload)
+        elif kind == "error":
+            run.error = payload
+        else:
+            self._forget(run)
+            run.finish()
+
+    def _forget(self, run: _Run) -> None:
+        self._by_id.pop(run.request_id, None)
+        if self._runs.get(run.key) is run:
+            del self._runs[run.key]
+
+    # ───────────────────────────  search control  ─────────────────────────
+    async def _submit(self, run: _Run) -> None:
+        slot = await self._free_slots.get()
+        self._cancel_flags[slot] = 0
+        run.slot = slot
+        try:
+            run.job = self._pool.submit(_stream_date, run.request_id, slot, run.key[1], run.limit)
+        except Exception as exc:         # broken or shut-down pool
+            self._free_slots.put_nowait(slot)
+            self._fail(run.request_id, exc)
+            return
+        run.job.add_done_callback(lambda job: self._loop.call_soon_threadsafe(
+            self._job_done, run.request_id, slot, job))
+
+    def _job_done(self, request_id: int, slot: int, job: Future) -> None:
+        # the slot is reusable once the job returned (or never started)
+        self._free_slots.put_nowait(slot)
+        # a worker that died never sent its "end": finish the stream here
+        if job.cancelled():
+            self._fail(request_id, asyncio.CancelledError())
+        elif job.exception() is not None:
+            self._fail(request_id, job.exception())
+
+    def _fail(self, request_id: int, exc: BaseException) -> None:
+        self._deliver(request_id, "error", exc)
+        self._deliver(request_id, "end", None)
+
+    def _started(self, run: _Run, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            self._fail(run.request_id, task.exception())
+
+    def _run_for(self, kind: str, date: Date, limit: Optional[int]) -> _Run:
+        key = (kind, date)
+        run = self._runs.get(key)
+        if run is None:
+            run = _Run(key, next(self._ids), limit)
+            self._runs[key] = run
+            self._by_id[run.request_id] = run
+            run.start_task = asyncio.ensure_future(self._submit(run))
+            run.start_task.add_done_callback(lambda task: self._started(run, task))
+        return run
+
+    def _cancel(self, run: _Run) -> None:
+        self._forget(run)
+        if run.start_task is not None and not run.start_task.done():
+            run.start_task.cancel()
+        if run.job is not None:
+            self._cancel_flags[run.slot] = 1
+            run.job.cancel()
+        run.finish()
+
+    async def _stream(self, kind: str, date: Date, limit: Optional[int]) -> AsyncIterator[Board]:
+        self._start()
+        run = self._run_for(kind, date, limit)
+        queue = run.subscribe()
+        try:
+            while True:
+                item = await queue.get()
+                if item is _END:
+                    if run.error is not None:
+                        raise run.error
+                    return
+                yield item
+        finally:
+            run.subscribers.remove(queue)
+            if not run.subscribers and not run.done:
+                self._cancel(run)
+
+    # ─────────────────────────────  public API  ───────────────────────────
+    async def solve_for_date_async(self, day: int, month: int, weekday: int) -> List[Board]:
+        """`FastCalendarPuzzleSolver.solve_for_date` without blocking the loop."""
+        limit = None if self.solver_kwargs.get("engine") == "dlx" else 1
+        stream = self._stream("solve", (day, month, weekday), limit)
+        try:
+            return [board async for board in stream]
+        finally:
+            await stream.aclose()
+
+    async def iter_solutions_async(self, day: int, month: int, weekday: int
+                                   ) -> AsyncIterator[Board]:
+        """Every solution board for the date, as the worker finds them."""
+        stream = self._stream("iter", (day, month, weekday), None)
+        try:
+            async for board in stream:
+                yield board
+        finally:
+            await stream.aclose()
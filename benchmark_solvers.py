@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+benchmark_solvers.py – repeatable solver benchmarks with machine-readable output
+
+Unlike compare_solvers.py (one time.time() sample per solver and date) every
+measurement here is:
+
+* preceded by warm-up runs that are not recorded,
+* repeated and timed with ``time.perf_counter_ns``,
+* summarised as median and inter-quartile range,
+* split into cold start (constructor building the orientation and placement
+  tables, table cache bypassed), cache-hit start (constructor reading those
+  tables from table_cache.py's blob) and warm solve (search only, on an
+  already built solver).
+
+Each timed solve starts from an empty transposition table so repeats measure
+the same work.  ``--worker-startup N`` also starts pools of N fast-solver
+workers and records each worker's constructor time and resident-memory
+growth when it rebuilds the tables, reads them from the table cache or
+attaches to tables published in shared memory.  ``--backends N`` times the
+full year and one date's split enumeration on N process workers against N
+threads (threads only pay off on a free-threaded build with the GIL
+disabled; the report records which kind of build ran).  Results are written
+as JSON.
+
+Usage (CLI):
+    ./benchmark_solvers.py                                # fast solvers, 3 dates + full year
+    ./benchmark_solvers.py --solvers fast fast-dlx --repeats 11 --output bench.json
+    ./benchmark_solvers.py --skip-year
+    ./benchmark_solvers.py --skip-year --worker-startup 4
+    ./benchmark_solvers.py --skip-year --backends 4
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from calendar_puzzle_solver import CalendarPuzzleSolver
+from dp_calendar_solver import DPCalendarPuzzleSolver
+from fast_dp_solver import FastCalendarPuzzleSolver
+from optimized_dp_solver import OptimizedDPSolver
+from parallel_solver import gil_enabled, measure_worker_startup
+from shared_tables import SharedPlacementTables
+
+# same calendar dates compare_solvers.py uses
+TEST_DATES: List[Tuple[int, int, int]] = [
+    (1, 1, 1),   # January 1st, Monday
+    (15, 3, 5),  # March 15th, Friday
+    (25, 12, 3), # December 25th, Wednesday
+]
+
+# name → factory(table_cache)
+SOLVERS: Dict[str, Callable[[bool], Any]] = {
+    "fast": lambda cache: FastCalendarPuzzleSolver(table_cache=cache),
+    "fast-noprune": lambda cache: FastCalendarPuzzleSolver(region_pruning=False, table_cache=cache),
+    "fast-notable": lambda cache: FastCalendarPuzzleSolver(option_table_size=0, table_cache=cache),
+    "fast-mrv": lambda cache: FastCalendarPuzzleSolver(cell_order="mrv", table_cache=cache),
+    "fast-fc": lambda cache: FastCalendarPuzzleSolver(forward_checking=True, table_cache=cache),
+    "fast-forced": lambda cache: FastCalendarPuzzleSolver(propagate_forced=True, table_cache=cache),
+    "fast-iterative": lambda cache: FastCalendarPuzzleSolver(engine="iterative", table_cache=cache),
+    "fast-dlx": lambda cache: FastCalendarPuzzleSolver(engine="dlx", table_cache=cache),
+    "dp": lambda cache: DPCalendarPuzzleSolver(table_cache=cache),
+    "optimized-dp": lambda cache: OptimizedDPSolver(table_cache=cache),
+    "brute-force": lambda cache: CalendarPuzzleSolver(),
+}
+
+# solvers without compiled tables: no cache-hit start to measure
+UNCACHED_SOLVERS = ("brute-force",)
+
+# date whose search tree --backends splits (the slowest of TEST_DATES)
+SPLIT_DATE = (25, 12, 3)
+
+# how pool workers get their placement tables
+WORKER_TABLE_MODES = ("rebuild", "table-cache", "shared-memory")
+
+# the DP and brute-force solvers take minutes per date and fast-dlx lists
+# every tiling (its full-year sweep runs for most of an hour); opt in explicitly
+DEFAULT_SOLVERS = ("fast", "fast-noprune")
+
+
+# ─────────────────────────────  statistics  ────────────────────────────
+def summarise(samples_ns: Sequence[int]) -> Dict[str, Any]:
+    """Median and inter-quartile range of nanosecond samples."""
+    if len(samples_ns) >= 2:
+        q1, _, q3 = statistics.quantiles(samples_ns, n=4, method="inclusive")
+    else:
+        q1 = q3 = samples_ns[0]
+    return {
+        "median_ns": int(statistics.median(samples_ns)),
+        "iqr_ns": int(q3 - q1),
+        "min_ns": min(samples_ns),
+        "max_ns": max(samples_ns),
+        "samples_ns": list(samples_ns),
+    }
+
+
+def _reset_search_state(solver: Any) -> None:
+    """Drop anything a previous run memoised so each sample does full work."""
+    if hasattr(solver, "clear_transposition_table"):
+        solver.clear_transposition_table()
+    if hasattr(solver, "memo"):
+        solver.memo.clear()
+
+
+def _timed(fn: Callable[[], Any], warmup: int, repeats: int,
+           before: Callable[[], None] = lambda: None) -> Tuple[List[int], Any]:
+    """Run `fn` warmup+repeats times, returning the timed samples and last result."""
+    result = None
+    for _ in range(warmup):
+        before()
+        result = fn()
+    samples: List[int] = []
+    for _ in range(repeats):
+        before()
+        start = time.perf_counter_ns()
+        result = fn()
+        samples.append(time.perf_counter_ns() - start)
+    return samples, result
+
+
+# ──────────────────────────────  benchmark  ────────────────────────────
+def benchmark_solver(name: str, warmup: int, repeats: int, year: bool, year_repeats: int,
+                     dates: Sequence[Tuple[int, int, int]] = TEST_DATES) -> Dict[str, Any]:
+    factory = SOLVERS[name]
+    entry: Dict[str, Any] = {"solver": name}
+
+    # solvers chatter on stdout; keep it out of the measurements' way
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold, solver = _timed(lambda: factory(False), warmup, repeats)
+        entry["cold_start"] = summarise(cold)
+        if name not in UNCACHED_SOLVERS:
+            factory(True)                # make sure the blob exists
+            cached, _ = _timed(lambda: factory(True), warmup, repeats)
+            entry["cached_start"] = summarise(cached)
+
+        warm = []
+        for day, month, weekday in dates:
+            samples, sols = _timed(lambda: solver.solve_for_date(day, month, weekday),
+                                   warmup, repeats, lambda: _reset_search_state(solver))
+            warm.append({"date": [day, month, weekday],
+                         "solutions": len(sols),
+                         **summarise(samples)})
+        entry["warm_solve"] = warm
+
+        if year and not hasattr(solver, "solve_all_dates"):
+            entry["full_year"] = {"skipped": f"{type(solver).__name__} has no solve_all_dates"}
+        elif year:
+            samples, res = _timed(solver.solve_all_dates, 0, year_repeats,
+                                  lambda: _reset_search_state(solver))
+            entry["full_year"] = {"dates_solved": len(res), **summarise(samples)}
+
+    return entry
+
+
+def benchmark_worker_startup(jobs: int, repeats: int) -> List[Dict[str, Any]]:
+    """Per-worker start-up time and RSS growth for each WORKER_TABLE_MODES entry."""
+    solver_cls = FastCalendarPuzzleSolver
+    publisher = solver_cls()             # also leaves a warm table cache behind
+    entries = []
+    for mode in WORKER_TABLE_MODES:
+        reports: List[Dict[str, int]] = []
+        for _ in range(repeats):
+            if mode == "shared-memory":
+                with SharedPlacementTables.publish(publisher) as shared:
+                    reports += measure_worker_startup(solver_cls, jobs,
+                                                      {"shared_tables": shared.handle})
+            else:
+                reports += measure_worker_startup(solver_cls, jobs,
+                                                  {"table_cache": mode == "table-cache"})
+        growth = [r["rss_growth_kb"] for r in reports]
+        entries.append({"mode": mode, "jobs": jobs,
+                        "init": summarise([r["init_ns"] for r in reports]),
+                        "rss_growth_kb": {"median": statistics.median(growth),
+                                          "max": max(growth)},
+                        "rss_kb": statistics.median(r["rss_kb"] for r in reports)})
+    return entries
+
+
+def benchmark_backends(jobs: int, repeats: int) -> List[Dict[str, Any]]:
+    """Full year and one split date on `jobs` processes vs `jobs` threads.
+
+    Every sample builds a new solver, so no transposition table carries
+    over between samples or backends.
+    """
+    entries = []
+    for backend in ("process", "thread"):
+        year, _ = _timed(lambda: FastCalendarPuzzleSolver().solve_all_dates(jobs, backend=backend),
+                         0, repeats)
+        split, sols = _timed(lambda: FastCalendarPuzzleSolver().solve_date_split(
+            *SPLIT_DATE, jobs=jobs, backend=backend), 0, repeats)
+        entries.append({"backend": backend, "jobs": jobs,
+                        "full_year": summarise(year),
+                        "split_date": {"date": list(SPLIT_DATE), "solutions": len(sols),
+                                       **summarise(split)}})
+    return entries
+
+
+def run_benchmarks(solver_names: Sequence[str], warmup: int = 1, repeats: int = 7,
+                   year: bool = True, year_repeats: int = 3,
+                   worker_jobs: int = 0, backend_jobs: int = 0) -> Dict[str, Any]:
+    report = {
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "gil_enabled": gil_enabled(),
+        "config": {"warmup": warmup, "repeats": repeats,
+                   "year": year, "year_repeats": year_repeats,
+                   "worker_jobs": worker_jobs, "backend_jobs": backend_jobs},
+        "results": [benchmark_solver(name, warmup, repeats, year, year_repeats)
+                    for name in solver_names],
+    }
+    if worker_jobs:
+        report["worker_startup"] = benchmark_worker_startup(worker_jobs, repeats)
+    if backend_jobs:
+        report["backends"] = benchmark_backends(backend_jobs, year_repeats)
+    return report
+
+
+def _format_ms(stats: Dict[str, Any]) -> str:
+    return f"{stats['median_ns'] / 1e6:10.3f} ms ± {stats['iqr_ns'] / 1e6:.3f}"
+
+
+def print_summary(report: Dict[str, Any]) -> None:
+    print(f"{'solver':<14} {'measurement':<16} {'median ± IQR':>24}")
+    print("-" * 56)
+    for entry in report["results"]:
+        name = entry["solver"]
+        print(f"{name:<14} {'cold start':<16} {_format_ms(entry['cold_start']):>24}")
+        if "cached_start" in entry:
+            print(f"{name:<14} {'cache-hit start':<16} {_format_ms(entry['cached_start']):>24}")
+        for d in entry["warm_solve"]:
+            label = "solve {}/{}/{}".format(*d["date"])
+            print(f"{name:<14} {label:<16} {_format_ms(d):>24}")
+        if "skipped" in entry.get("full_year", {}):
+            print(f"{name:<14} {'full year':<16} skipped: {entry['full_year']['skipped']}")
+        elif "full_year" in entry:
+            print(f"{name:<14} {'full year':<16} {_format_ms(entry['full_year']):>24}")
+    for entry in report.get("worker_startup", []):
+        label = f"worker init ×{entry['jobs']}"
+        print(f"{entry['mode']:<14} {label:<16} {_format_ms(entry['init']):>24}"
+              f"   RSS +{entry['rss_growth_kb']['median']:.0f} KiB"
+              f" (total {entry['rss_kb']:.0f} KiB)")
+    for entry in report.get("backends", []):
+        name = f"{entry['backend']} ×{entry['jobs']}"
+        label = "split {}/{}/{}".format(*entry["split_date"]["date"])
+        print(f"{name:<14} {'full year':<16} {_format_ms(entry['full_year']):>24}")
+        print(f"{name:<14} {label:<16} {_format_ms(entry['split_date']):>24}")
+
+
+# ───────────────────────────  CLI entry  ─────────────────────────────
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark calendar puzzle solvers")
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS),
+                        default=list(DEFAULT_SOLVERS))
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs per measurement")
+    parser.add_argument("--repeats", type=int, default=7, help="timed runs per measurement")
+    parser.add_argument("--year-repeats", type=int, default=3, help="timed full-year sweeps")
+    parser.add_argument("--skip-year", action="store_true", help="skip the full-year sweep")
+    parser.add_argument("--worker-startup", type=int, default=0, metavar="JOBS",
+                        help="also measure start-up of JOBS pool workers per table mode")
+    parser.add_argument("--backends", type=int, default=0, metavar="JOBS",
+                        help="also compare JOBS processes against JOBS threads")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="JSON report path ('-' for stdout)")
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.solvers, args.warmup, args.repeats,
+                            not args.skip_year, args.year_repeats, args.worker_startup,
+                            args.backends)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print_summary(report)
+        print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    _main()
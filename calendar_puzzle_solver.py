@@ -4,8 +4,14 @@ from typing import List, Tuple, Dict, Set
 from datetime import datetime, timedelta
 import itertools
 
+from parallel_solver import solutions_by_date, solve_dates_in_pool
+from search_stats import SearchStats
+
 class CalendarPuzzleSolver:
-    def __init__(self):
+    def __init__(self, collect_stats: bool = False):
+        # Constructor arguments, replayed when worker processes build a copy
+        self._options = {"collect_stats": collect_stats}
+        
         # Game board layout
         self.board = [
             ["1",  "2",  "3",  "4",  "OCA", "♥",  "PZT"],   # Row 0
@@ -113,6 +119,9 @@ class CalendarPuzzleSolver:
         for piece in self.pieces:
             orientations = self.generate_all_orientations(piece)
             self.all_piece_orientations.append(orientations)
+        
+        # Search counters (None when disabled)
+        self.stats = SearchStats() if collect_stats else None
     
     def rotate_90(self, piece: List[List[int]]) -> List[List[int]]:
         """Rotate piece 90 degrees clockwise"""
@@ -240,9 +249,22 @@ class CalendarPuzzleSolver:
                     return False
         return True
     
+    def _tally_candidate(self, stats: SearchStats, depth: int, board_state: List[List[int]],
+                         piece: List[List[int]], start_row: int, start_col: int) -> None:
+        """Count an in-bounds candidate, and whether a covered cell rejected it"""
+        if (start_row + len(piece) > self.board_height
+                or start_col + len(piece[0]) > self.board_width):
+            return
+        fits = self.can_place_piece(board_state, piece, start_row, start_col)
+        stats.tally(depth, 1, 0 if fits else 1)
+    
     def solve_backtrack(self, board_state: List[List[int]], piece_index: int, 
                        used_pieces: Set[int]) -> List[Dict]:
         """Backtracking solver that returns all solutions"""
+        stats = self.stats
+        if stats is not None:
+            stats.enter(piece_index)
+        
         if piece_index == len(self.pieces):
             if self.is_board_complete(board_state):
                 return [copy.deepcopy(board_state)]
@@ -259,6 +281,9 @@ class CalendarPuzzleSolver:
             # Try all positions on the board
             for row in range(self.board_height):
                 for col in range(self.board_width):
+                    if stats is not None:
+                        self._tally_candidate(stats, piece_index, board_state, orientation, row, col)
+                    
                     if self.can_place_piece(board_state, orientation, row, col):
                         # Place the piece
                         self.place_piece(board_state, orientation, row, col, piece_index + 1)
@@ -295,6 +320,9 @@ class CalendarPuzzleSolver:
         
         print(f"Solving for {day} {month_abbr} {day_abbr}...")
         
+        if self.stats is not None:
+            self.stats.reset()
+        
         board_state = self.create_initial_board_state(day, month_abbr, day_abbr)
         solutions = self.solve_backtrack(board_state, 0, set())
         
@@ -321,12 +349,22 @@ class CalendarPuzzleSolver:
         
         return valid_dates
     
-    def solve_all_dates(self) -> Dict[str, List]:
-        """Solve puzzle for all valid dates and return results"""
+    def solve_all_dates(self, jobs: int = 1) -> Dict[str, List]:
+        """Solve puzzle for all valid dates and return results
+        
+        jobs > 1 hands the dates to a pool of that many processes, each
+        with its own solver built from this one's options.
+        """
         valid_dates = self.generate_valid_dates()
         all_solutions = {}
         
         total_dates = len(valid_dates)
+        
+        if jobs > 1:
+            print(f"Solving for {total_dates} dates on {jobs} processes...")
+            results = solve_dates_in_pool(type(self), valid_dates, jobs, self._options)
+            return solutions_by_date(valid_dates, results, self.months, self.days)
+        
         print(f"Solving for {total_dates} dates...")
         
         for i, (day, month, weekday) in enumerate(valid_dates):
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+dead_state_cache.py – proven-dead search states persisted across runs
+
+A dead state (packed ``board_mask << 10 | used_mask`` that admits no tiling)
+stays dead for every date and every later run, as long as BOARD and PIECES
+do not change.  ``DeadStateCache`` keeps such states in an sqlite file
+tagged with the definition hash; opening it with a different hash empties
+it.  The file is only opened on the first lookup or write.
+
+``PersistentTranspositionTable`` is a TranspositionTable whose misses fall
+back to that file and whose dead entries are written through to it (in
+batches), so a capacity-bounded table in memory loses nothing when it
+evicts; ``persist()`` flushes the last batch at the end of a run.
+
+The fast and the DP solver number bits and pieces identically, so they can
+share one cache file.
+
+Usage (CLI):
+    ./fast_dp_solver.py --dead-cache dead_states.sqlite
+    ./dp_calendar_solver.py --dead-cache dead_states.sqlite
+"""
+
+from __future__ import annotations
+import sqlite3
+from typing import Any, Dict, Iterable, Optional, Set
+
+from transposition_table import TranspositionTable
+
+# pending writes are flushed to sqlite in batches of this size
+FLUSH_EVERY = 10_000
+
+
+class DeadStateCache:
+    """sqlite set of dead packed states for one puzzle definition."""
+
+    def __init__(self, path: str, definition_hash: str, preload: bool = False) -> None:
+        self.path = path
+        self.definition_hash = definition_hash
+        # preload: read every stored state into a set on first use and answer
+        # lookups from memory (for unbounded tables); otherwise query per key
+        self.preload = preload
+        self._loaded: Set[int] = set()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: Set[int] = set()
+        # False while the file holds no states: lookups then skip sqlite
+        self._on_disk = True
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            # a lost tail only costs recomputation, so trade durability for speed
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS dead_states (state INTEGER PRIMARY KEY)")
+            row = conn.execute("SELECT value FROM meta WHERE key = 'definition'").fetchone()
+            if row is None or row[0] != self.definition_hash:
+                # written for another BOARD/PIECES: none of its states apply
+                conn.execute("DELETE FROM dead_states")
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('definition', ?)",
+                             (self.definition_hash,))
+                conn.commit()
+            self._on_disk = conn.execute("SELECT EXISTS (SELECT 1 FROM dead_states)").fetchone()[0] == 1
+            if self.preload and self._on_disk:
+                self._loaded = {row[0] for row in conn.execute("SELECT state FROM dead_states")}
+            self._conn = conn
+        return self._conn
+
+    def __contains__(self, key: int) -> bool:
+        if key in self._pending:
+            return True
+        conn = self._connect()
+        if self.preload:
+            return key in self._loaded
+        if not self._on_disk:
+            return False
+        cursor = conn.execute("SELECT 1 FROM dead_states WHERE state = ?", (key,))
+        return cursor.fetchone() is not None
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._connect().execute("SELECT COUNT(*) FROM dead_states").fetchone()[0]
+
+    def add(self, key: int) -> None:
+        self._pending.add(key)
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def update(self, keys: Iterable[int]) -> None:
+        self._pending.update(keys)
+        if len(self._pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending states to disk."""
+        if not self._pending:
+            return
+        conn = self._connect()
+        conn.executemany("INSERT OR IGNORE INTO dead_states VALUES (?)",
+                         ((key,) for key in sorted(self._pending)))
+        conn.commit()
+        if self.preload:
+            self._loaded |= self._pending
+        self._pending.clear()
+        self._on_disk = True
+
+    def close(self) -> None:
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class PersistentTranspositionTable(TranspositionTable):
+    """TranspositionTable backed by a DeadStateCache.
+
+    `dead_value` is what the owning solver stores for a dead state (True for
+    the fast solver's dead-state table, [] or 0 for the DP memos).  Entries
+    holding it are written through to the cache as they are stored, so
+    evicting them from a full table loses nothing.
+    """
+
+    def __init__(self, cache: DeadStateCache, capacity: Optional[int] = None,
+                 policy: str = "lru", dead_value: Any = True) -> None:
+        self.cache = cache
+        self.dead_value = dead_value
+        self.disk_hits = 0
+        super().__init__(capacity, policy)
+
+    def get(self, key: int, default: Any = None) -> Any:
+        value = super().get(key)
+        if value is not None:
+            return value
+        if key in self.cache:
+            self.disk_hits += 1
+            super().put(key, self.dead_value)
+            return self.dead_value
+        return default
+
+    def put(self, key: int, value: Any) -> None:
+        if value == self.dead_value:
+            self.cache.add(key)
+        super().put(key, value)
+
+    def persist(self) -> None:
+        """Flush dead states still waiting to be written."""
+        self.cache.flush()
+
+    def counters(self) -> Dict[str, Any]:
+        return {**super().counters(), "disk_hits": self.disk_hits}
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+distributed_solver.py – enumerate every tiling on several machines
+
+A coordinator splits the work into units – one per date, or one per search
+state ``--split-depth`` placements below a date's root (see
+``FastCalendarPuzzleSolver.solve_date_split``) – and serves them over TCP
+with ``multiprocessing.managers``.  Workers connect, lease a unit, search it
+and send back its tilings as solution-store records.
+
+Leases expire after ``--lease`` seconds unless the worker renews them (a
+background thread does so while a unit is being searched), so the units of
+a worker that died or lost its connection go back to the front of the queue
+for someone else.  A late result for a unit that was already completed is
+ignored; both copies are identical anyway.
+
+When every unit is done the coordinator keeps answering "done" until every
+worker it has seen was told so (or ``DRAIN_SECONDS`` passed, for workers
+that died), then writes all dates to a binary solution store
+(solution_store.py), tilings in the serial search order.  A worker that
+loses the connection to the coordinator treats it as "done" too.
+
+Usage (CLI):
+    ./distributed_solver.py coordinator --bind 0.0.0.0:50000 --authkey s3cret \\
+        --output all_triples.bin                    # all 31×12×7 triples
+    ./distributed_solver.py coordinator --bind 127.0.0.1:50000 --authkey s3cret \\
+        --calendar-dates --split-depth 1 --output year.bin
+    ./distributed_solver.py worker --connect coordinator-host:50000 --authkey s3cret \\
+        --processes 4
+"""
+
+from __future__ import annotations
+import argparse
+import itertools
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from collections import deque
+from multiprocessing.managers import BaseManager
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+
+from fast_dp_solver import FastCalendarPuzzleSolver
+from solution_store import Record, date_key, moves_to_record, write_store
+
+Date = Tuple[int, int, int]          # (day, month, weekday)
+# unit id, date, moves above the state, board_mask, used_mask
+Unit = Tuple[int, Date, List[Tuple[int, int]], int, int]
+
+DEFAULT_LEASE_SECONDS = 60.0
+# how long a finished coordinator waits for idle workers to hear "done"
+DRAIN_SECONDS = 5.0
+
+
+# ────────────────────────────  COORDINATOR  ───────────────────────────
+class Coordinator:
+    """Work queue with leases; served to workers through a manager.
+
+    The manager answers each connection on its own thread, so every public
+    method holds the lock.
+    """
+
+    def __init__(self, units: Sequence[Unit], lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 solver_options: Optional[Dict[str, Any]] = None,
+                 definition_hash: str = "") -> None:
+        self.units: Dict[int, Unit] = {unit[0]: unit for unit in units}
+        self.lease_seconds = lease_seconds
+        self.solver_options = dict(solver_options or {})
+        self.definition_hash = definition_hash
+        self._pending: Deque[int] = deque(self.units)
+        self._leases: Dict[int, Tuple[str, float]] = {}   # unit → (worker, deadline)
+        self._results: Dict[int, List[Record]] = {}
+        self.reassigned = 0
+        # workers that leased or polled and have not been told "done" yet
+        self._active_workers: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def config(self) -> Tuple[Dict[str, Any], str, float]:
+        """Solver options, definition hash and lease length for workers."""
+        return self.solver_options, self.definition_hash, self.lease_seconds
+
+    def _reclaim_expired(self) -> None:
+        now = time.monotonic()
+        for unit_id, (_, deadline) in list(self._leases.items()):
+            if deadline < now:
+                del self._leases[unit_id]
+                self._pending.appendleft(unit_id)
+                self.reassigned += 1
+
+    def lease(self, worker: str) -> Tuple[str, Optional[Unit]]:
+        """("unit", unit) to work on, ("wait", None) while every remaining
+        unit is leased to someone else, or ("done", None)."""
+        with self._lock:
+            self._reclaim_expired()
+            self._active_workers.add(worker)
+            while self._pending:
+                unit_id = self._pending.popleft()
+                if unit_id in self._results:
+                    continue
+                self._leases[unit_id] = (worker, time.monotonic() + self.lease_seconds)
+                return "unit", self.units[unit_id]
+            if self._leases:
+                return "wait", None
+            self._active_workers.discard(worker)
+            return "done", None
+
+    def renew(self, worker: str, unit_id: int) -> bool:
+        """Extend `worker`'s lease on `unit_id`; False once it has lost it."""
+        with self._lock:
+            holder = self._leases.get(unit_id)
+            if holder is None or holder[0] != worker:
+                return False
+            self._leases[unit_id] = (worker, time.monotonic() + self.lease_seconds)
+            return True
+
+    def complete(self, worker: str, unit_id: int, records: List[Record]) -> bool:
+        """Store a unit's records; False if it had already been completed."""
+        with self._lock:
+            self._leases.pop(unit_id, None)
+            if unit_id in self._results:
+                return False
+            self._results[unit_id] = records
+            return True
+
+    def progress(self) -> Tuple[int, int, int]:
+        """(units done, units leased, total units)."""
+        with self._lock:
+            return len(self._results), len(self._leases), len(self.units)
+
+    def finished(self) -> bool:
+        with self._lock:
+            return len(self._results) == len(self.units)
+
+    def drained(self) -> bool:
+        """True once every worker seen so far has been told "done"."""
+        with self._lock:
+            return not self._active_workers
+
+    def solutions(self) -> Dict[Date, List[Record]]:
+        """Records per date, units (and so tilings) in serial search order."""
+        with self._lock:
+            out: Dict[Date, List[Record]] = {}
+            for unit_id in sorted(self.units):
+                date = self.units[unit_id][1]
+                out.setdefault(date, []).extend(self._results.get(unit_id, []))
+            return out
+
+
+class _ServerManager(BaseManager):
+    pass
+
+
+class _ClientManager(BaseManager):
+    pass
+
+
+_ClientManager.register("coordinator")
+
+
+def all_triples() -> List[Date]:
+    """Every (day, month, weekday) combination, calendar-valid or not."""
+    return [(day, month, weekday)
+            for month, day, weekday in itertools.product(range(1, 13), range(1, 32), range(1, 8))]
+
+
+def build_units(solver: FastCalendarPuzzleSolver, dates: Sequence[Date],
+                split_depth: int = 0) -> List[Unit]:
+    """Work units for `dates`: each date's search states `split_depth` deep."""
+    units: List[Unit] = []
+    for date in dates:
+        for moves, board_mask, used_mask in solver.date_frontier(*date, split_depth):
+            units.append((len(units), date, moves, board_mask, used_mask))
+    return units
+
+
+def run_coordinator(address: Tuple[str, int], authkey: bytes, output: str,
+                    dates: Optional[Sequence[Date]] = None, split_depth: int = 0,
+                    lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                    solver_kwargs: Optional[Dict[str, Any]] = None,
+                    poll_seconds: float = 1.0, verbose: bool = True,
+                    drain_seconds: float = DRAIN_SECONDS) -> Dict[Date, List[Record]]:
+    """Serve `dates` (default: all triples) until workers finished them all,
+    then write the solution store to `output` and return its contents.
+
+    The server stays up until every worker has been told "done", or for at
+    most `drain_seconds` once the work is finished.
+    """
+    solver = FastCalendarPuzzleSolver(**(solver_kwargs or {}))
+    dates = all_triples() if dates is None else list(dates)
+    units = build_units(solver, dates, split_depth)
+    coordinator = Coordinator(units, lease_seconds, solver_kwargs, solver.definition_hash())
+
+    _ServerManager.register("coordinator", callable=lambda: coordinator)
+    server = _ServerManager(address=address, authkey=authkey).get_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    if verbose:
+        print(f"Coordinator on {server.address[0]}:{server.address[1]}: {len(units)} units")
+
+    last = None
+    while not coordinator.finished():
+        time.sleep(poll_seconds)
+        state = coordinator.progress()
+        if verbose and state != last:
+            print(f"  {state[0]}/{state[2]} units done, {state[1]} leased, "
+                  f"{coordinator.reassigned} reassigned")
+            last = state
+
+    deadline = time.monotonic() + drain_seconds
+    while not coordinator.drained() and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    server.stop_event.set()
+    thread.join(timeout=5)
+    server.listener.close()
+
+    # dates whose every branch was pruned have no units but still get an entry
+    found = coordinator.solutions()
+    solutions = {date: found.get(date, []) for date in dates}
+    write_store(output, solver, solutions)
+    if verbose:
+        print(f"Wrote {sum(map(len, solutions.values()))} solutions for "
+              f"{len(solutions)} dates to {output}")
+    return solutions
+
+
+# ──────────────────────────────  WORKER  ──────────────────────────────
+def _keep_lease(coordinator: Any, worker: str, unit_id: int, interval: float,
+                stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        try:
+            if not coordinator.renew(worker, unit_id):
+                return
+        except (EOFError, ConnectionError):
+            return
+
+
+def run_worker(address: Tuple[str, int], authkey: bytes,
+               max_units: Optional[int] = None, verbose: bool = False) -> int:
+    """Lease and solve units until the coordinator has none left (or
+    `max_units` are done); returns the number of units completed."""
+    manager = _ClientManager(address=address, authkey=authkey)
+    manager.connect()
+    coordinator = manager.coordinator()
+    solver_kwargs, definition_hash, lease_seconds = coordinator.config()
+    solver = FastCalendarPuzzleSolver(**solver_kwargs)
+    if solver.definition_hash() != definition_hash:
+        raise ValueError("worker's BOARD/PIECES differ from the coordinator's")
+
+    worker = f"{socket.gethostname()}:{os.getpid()}"
+    done = 0
+    while max_units is None or done < max_units:
+        try:
+            status, unit = coordinator.lease(worker)
+        except (EOFError, ConnectionError):
+            # the coordinator only shuts down once every unit is done
+            break
+        if status == "done":
+            break
+        if status == "wait":
+            time.sleep(min(1.0, lease_seconds / 4))
+            continue
+
+        unit_id, date, prefix, board_mask, used_mask = unit
+        stop = threading.Event()
+        keeper = threading.Thread(target=_keep_lease,
+                                  args=(coordinator, worker, unit_id, lease_seconds / 3, stop),
+                                  daemon=True)
+        keeper.start()
+        try:
+            tilings = solver.search_subtree(board_mask, used_mask)
+        finally:
+            stop.set()
+            keeper.join()
+        records = [moves_to_record(solver, prefix + moves) for moves in tilings]
+        try:
+            coordinator.complete(worker, unit_id, records)
+        except (EOFError, ConnectionError):
+            # gone: it finished without us (this unit was reassigned)
+            break
+        done += 1
+        if verbose:
+            print(f"[{worker}] unit {unit_id} ({date_key(*date)}): {len(records)} tilings")
+    return done
+
+
+# ───────────────────────────  CLI entry  ─────────────────────────────
+def _parse_address(text: str) -> Tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Distributed calendar puzzle enumeration")
+    sub = parser.add_subparsers(dest="role", required=True)
+
+    coord = sub.add_parser("coordinator", help="hand out work and collect results")
+    coord.add_argument("--bind", default="127.0.0.1:50000", help="host:port to listen on")
+    coord.add_argument("--authkey", required=True, help="shared secret for workers")
+    coord.add_argument("--output", default="all_triples.bin", help="solution store to write")
+    coord.add_argument("--calendar-dates", action="store_true",
+                       help="only the 365 dates of 2024 (DAYS_IN_MONTH gives February 28 "
+                            "days) instead of all 2604 triples")
+    coord.add_argument("--split-depth", type=int, default=0,
+                       help="hand out search states this many placements deep (0 = whole dates)")
+    coord.add_argument("--lease", type=float, default=DEFAULT_LEASE_SECONDS,
+                       help="seconds before an unrenewed unit is reassigned")
+
+    work = sub.add_parser("worker", help="solve units leased from a coordinator")
+    work.add_argument("--connect", default="127.0.0.1:50000", help="coordinator host:port")
+    work.add_argument("--authkey", required=True, help="shared secret of the coordinator")
+    work.add_argument("--processes", type=int, default=1, help="worker processes to run here")
+    args = parser.parse_args()
+
+    authkey = args.authkey.encode("utf-8")
+    if args.role == "coordinator":
+        dates = FastCalendarPuzzleSolver()._valid_dates() if args.calendar_dates else None
+        run_coordinator(_parse_address(args.bind), authkey, args.output,
+                        dates, args.split_depth, args.lease)
+        return
+
+    address = _parse_address(args.connect)
+    if args.processes == 1:
+        run_worker(address, authkey, verbose=True)
+        return
+    procs = [multiprocessing.Process(target=run_worker, args=(address, authkey),
+                                     kwargs={"verbose": True})
+             for _ in range(args.processes)]
+    for proc in procs:
+        proc.start()
+    for proc in procs:
+        proc.join()
+
+
+if __name__ == "__main__":
+    _main()
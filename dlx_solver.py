@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+dlx_solver.py – Knuth's Algorithm X with Dancing Links
+
+A small, dependency-free exact-cover engine.  Columns are plain integers
+``0 … n_columns-1``; every row is the list of columns it covers.  The
+search always branches on the column with the fewest remaining rows and
+yields every exact cover as a list of row indices.
+"""
+
+from __future__ import annotations
+from typing import Callable, Iterator, List, Optional, Sequence
+
+
+class DancingLinks:
+    """Exact-cover matrix stored as a toroidal doubly-linked list.
+
+    The links live in flat parallel lists (``left``, ``right``, ``up``,
+    ``down``, ``col``) instead of node objects – node 0 is the root header,
+    nodes ``1 … n_columns`` are the column headers and every 1 in the
+    matrix gets one node after that.
+    """
+
+    def __init__(self, n_columns: int, rows: Sequence[Sequence[int]]) -> None:
+        self.n_columns = n_columns
+        size = n_columns + 1
+
+        self.left: List[int] = [i - 1 for i in range(size)]
+        self.right: List[int] = [i + 1 for i in range(size)]
+        self.left[0] = n_columns
+        self.right[n_columns] = 0
+        self.up: List[int] = list(range(size))
+        self.down: List[int] = list(range(size))
+        self.col: List[int] = list(range(size))
+        self.row_of: List[int] = [-1] * size
+        self.count: List[int] = [0] * size          # rows left per column
+        self._on_node: Optional[Callable[[int, int], None]] = None
+
+        for r_idx, columns in enumerate(rows):
+            first = -1
+            for c in columns:
+                header = c + 1
+                node = len(self.col)
+                # append below the current last node of the column
+                self.col.append(header)
+                self.row_of.append(r_idx)
+                self.up.append(self.up[header])
+                self.down.append(header)
+                self.down[self.up[header]] = node
+                self.up[header] = node
+                self.count[header] += 1
+                # splice into the row ring
+                if first < 0:
+                    first = node
+                    self.left.append(node)
+                    self.right.append(node)
+                else:
+                    self.left.append(self.left[first])
+                    self.right.append(first)
+                    self.right[self.left[first]] = node
+                    self.left[first] = node
+
+    # ─────────────────────────────  LINK SURGERY  ──────────────────────────
+    def _cover(self, header: int) -> None:
+        left, right, up, down, col, count = (
+            self.left, self.right, self.up, self.down, self.col, self.count)
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        i = down[header]
+        while i != header:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                count[col[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def _uncover(self, header: int) -> None:
+        left, right, up, down, col, count = (
+            self.left, self.right, self.up, self.down, self.col, self.count)
+        i = up[header]
+        while i != header:
+            j = left[i]
+            while j != i:
+                count[col[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    # ──────────────────────────────  SEARCH  ───────────────────────────────
+    def solutions(self, on_node: Optional[Callable[[int, int], None]] = None
+                  ) -> Iterator[List[int]]:
+        """Yield every exact cover as a list of row indices.
+
+        `on_node`, if given, is called at every search node with its depth
+        (rows chosen so far) and the number of rows it branches on (0 at a
+        cover or a dead end); an exception it raises aborts the search (the
+        matrix is left half-covered).
+        """
+        self._on_node = on_node
+        partial: List[int] = []
+        yield from self._search(partial)
+
+    def _search(self, partial: List[int]) -> Iterator[List[int]]:
+        right, down, col, count = self.right, self.down, self.col, self.count
+
+        if right[0] == 0:
+            if self._on_node is not None:
+                self._on_node(len(partial), 0)
+            yield list(partial)
+            return
+
+        # branch on the column with the fewest candidate rows
+        best = right[0]
+        best_count = count[best]
+        c = right[best]
+        while c != 0 and best_count > 1:
+            if count[c] < best_count:
+                best, best_count = c, count[c]
+            c = right[c]
+        if self._on_node is not None:
+            self._on_node(len(partial), best_count)
+        if best_count == 0:
+            return
+
+        self._cover(best)
+        r = down[best]
+        while r != best:
+            partial.append(self.row_of[r])
+            j = right[r]
+            while j != r:
+                self._cover(col[j])
+                j = right[j]
+
+            yield from self._search(partial)
+
+            j = self.left[r]
+            while j != r:
+                self._uncover(col[j])
+                j = self.left[j]
+            partial.pop()
+            r = down[r]
+        self._uncover(best)
@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 
+import argparse
+import hashlib
 import json
 import copy
 from typing import List, Tuple, Dict, Set, Optional
 from datetime import datetime
 import functools
 
+from parallel_solver import solutions_by_date, solve_dates_in_pool
+from search_stats import SearchStats
+from transposition_table import TranspositionTable, pack_state
+from dead_state_cache import DeadStateCache, PersistentTranspositionTable
+from table_cache import code_fingerprint, load_tables, save_tables
+
 class DPCalendarPuzzleSolver:
-    def __init__(self):
+    def __init__(self, collect_stats: bool = False,
+                 tt_capacity: Optional[int] = None, tt_policy: str = "lru",
+                 dead_cache: Optional[str] = None, table_cache: bool = True):
+        # Constructor arguments, replayed when worker processes build a copy
+        self._options = {"collect_stats": collect_stats, "tt_capacity": tt_capacity,
+                         "tt_policy": tt_policy, "dead_cache": dead_cache,
+                         "table_cache": table_cache}
+        
         # Game board layout
         self.board = [
             ["1",  "2",  "3",  "4",  "OCA", "♥",  "PZT"],   # Row 0
@@ -99,7 +114,69 @@ class DPCalendarPuzzleSolver:
         self.board_height = len(self.board)
         self.board_width = len(self.board[0])
         
-        # Pre-compute piece orientations and bit representations
+        # Piece orientations, bit patterns, the cell → bit map and every
+        # placement covering each cell; a warm table cache (see
+        # table_cache.py) replaces building them with one file read
+        fingerprint = self.tables_fingerprint()
+        tables = load_tables("dp", self.definition_hash(), fingerprint) if table_cache else None
+        if tables is None:
+            tables = self.compile_tables(include_cell_placements=table_cache)
+            if table_cache:
+                save_tables("dp", self.definition_hash(), fingerprint, tables)
+        self.all_piece_orientations = tables["all_piece_orientations"]
+        self.piece_bit_patterns = tables["piece_bit_patterns"]
+        self.pos_to_bit = tables["pos_to_bit"]
+        self.bit_to_pos = tables["bit_to_pos"]
+        self.total_bits = len(self.pos_to_bit)
+        
+        # Memoization cache: packed (board_mask, used_pieces) -> solutions,
+        # optionally capped at tt_capacity entries (LRU or clock eviction)
+        self.dead_cache = dead_cache
+        if dead_cache is None:
+            self.memo = TranspositionTable(tt_capacity, tt_policy)
+            
+            # Count-only memoization: packed (board_mask, used_pieces) -> number of tilings
+            self.count_memo = TranspositionTable(tt_capacity, tt_policy)
+        else:
+            # Dead states ([] solutions / 0 tilings) shared with earlier runs on disk
+            cache = DeadStateCache(dead_cache, self.definition_hash(),
+                                   preload=tt_capacity is None)
+            self.memo = PersistentTranspositionTable(cache, tt_capacity, tt_policy,
+                                                     dead_value=[])
+            self.count_memo = PersistentTranspositionTable(cache, tt_capacity, tt_policy,
+                                                           dead_value=0)
+        
+        # For each bit position, every (piece_idx, piece_mask) covering it
+        # (from the table cache, else built lazily by count_solutions)
+        self.cell_placements = tables.get("cell_placements")
+        
+        # Statistics
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # Detailed search counters (None when disabled)
+        self.stats = SearchStats() if collect_stats else None
+    
+    def definition_hash(self) -> str:
+        """SHA-256 of the board and pieces (same value as the fast solver's)."""
+        blob = json.dumps([self.board, self.pieces], ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+    
+    def persist_dead_states(self):
+        """Write dead states from both memos to `dead_cache`, if one is set."""
+        if self.dead_cache is not None:
+            self.memo.persist()
+            self.count_memo.persist()
+    
+    def tables_fingerprint(self) -> str:
+        """Hash of the code building the cached tables"""
+        return code_fingerprint(
+            self.compile_tables, self.generate_all_orientations, self.rotate_90,
+            self.flip_horizontal, self.flip_vertical, self.normalize_piece,
+            self.piece_to_positions, self.build_cell_placements, self.can_place_piece_at)
+    
+    def compile_tables(self, include_cell_placements: bool = True) -> Dict:
+        """Build the tables cached by table_cache from the board and pieces"""
         self.all_piece_orientations = []
         self.piece_bit_patterns = []
         
@@ -127,12 +204,15 @@ class DPCalendarPuzzleSolver:
         
         self.total_bits = bit_index
         
-        # Memoization cache
-        self.memo = {}
-        
-        # Statistics
-        self.cache_hits = 0
-        self.cache_misses = 0
+        tables = {
+            "all_piece_orientations": self.all_piece_orientations,
+            "piece_bit_patterns": self.piece_bit_patterns,
+            "pos_to_bit": self.pos_to_bit,
+            "bit_to_pos": self.bit_to_pos,
+        }
+        if include_cell_placements:
+            tables["cell_placements"] = self.build_cell_placements()
+        return tables
     
     def rotate_90(self, piece: List[List[int]]) -> List[List[int]]:
         """Rotate piece 90 degrees clockwise"""
@@ -257,13 +337,23 @@ class DPCalendarPuzzleSolver:
     def solve_dp(self, board_mask: int, used_pieces: int, target_mask: int) -> List[Dict[str, any]]:
         """Dynamic programming solver with memoization"""
         # Create cache key
-        cache_key = (board_mask, used_pieces)
+        cache_key = pack_state(board_mask, used_pieces)
+        
+        stats = self.stats
+        if stats is not None:
+            depth = bin(used_pieces).count("1")
+            stats.enter(depth)
         
-        if cache_key in self.memo:
+        cached = self.memo.get(cache_key)
+        if cached is not None:
             self.cache_hits += 1
-            return self.memo[cache_key]
+            if stats is not None:
+                stats.memo_hits += 1
+            return cached
         
         self.cache_misses += 1
+        if stats is not None:
+            stats.memo_misses += 1
         
         # Check if all pieces are used
         if used_pieces == (1 << len(self.pieces)) - 1:
@@ -273,7 +363,7 @@ class DPCalendarPuzzleSolver:
                 result = [{"board_mask": board_mask, "used_pieces": used_pieces}]
             else:
                 result = []
-            self.memo[cache_key] = result
+            self.memo.put(cache_key, result)
             return result
         
         solutions = []
@@ -292,6 +382,14 @@ class DPCalendarPuzzleSolver:
                             board_mask, piece_positions, start_row, start_col
                         )
                         
+                        if stats is not None:
+                            # Off-board positions are not placements; a spot that
+                            # fits the empty board but failed here overlapped
+                            if can_place:
+                                stats.tally(depth, 1, 0)
+                            elif self.can_place_piece_at(0, piece_positions, start_row, start_col)[0]:
+                                stats.tally(depth, 1, 1)
+                        
                         if can_place:
                             new_board_mask = board_mask | piece_mask
                             new_used_pieces = used_pieces | (1 << piece_idx)
@@ -310,9 +408,124 @@ class DPCalendarPuzzleSolver:
                                 solutions.append(enhanced_sol)
         
         # Cache and return results
-        self.memo[cache_key] = solutions
+        self.memo.put(cache_key, solutions)
         return solutions
     
+    def build_cell_placements(self) -> List[List[Tuple[int, int]]]:
+        """List every (piece_idx, piece_mask) placement that covers each bit position"""
+        cell_placements = [[] for _ in range(self.total_bits)]
+        
+        for piece_idx in range(len(self.pieces)):
+            seen_masks = set()
+            for piece_positions in self.piece_bit_patterns[piece_idx]:
+                for start_row in range(self.board_height):
+                    for start_col in range(self.board_width):
+                        can_place, piece_mask = self.can_place_piece_at(
+                            0, piece_positions, start_row, start_col
+                        )
+                        if not can_place or piece_mask in seen_masks:
+                            continue
+                        seen_masks.add(piece_mask)
+                        
+                        for bit_pos in range(self.total_bits):
+                            if piece_mask & (1 << bit_pos):
+                                cell_placements[bit_pos].append((piece_idx, piece_mask))
+        
+        return cell_placements
+    
+    def count_dp(self, board_mask: int, used_pieces: int) -> int:
+        """Count tilings of the uncovered cells, memoizing integer counts only.
+        
+        Always branches on the lowest uncovered bit, so every tiling is
+        counted exactly once regardless of the order pieces are placed in.
+        """
+        cache_key = pack_state(board_mask, used_pieces)
+        
+        stats = self.stats
+        if stats is not None:
+            depth = bin(used_pieces).count("1")
+            stats.enter(depth)
+        
+        count = self.count_memo.get(cache_key)
+        if count is not None:
+            self.cache_hits += 1
+            if stats is not None:
+                stats.memo_hits += 1
+            return count
+        
+        self.cache_misses += 1
+        if stats is not None:
+            stats.memo_misses += 1
+        
+        full_mask = (1 << self.total_bits) - 1
+        if board_mask == full_mask:
+            count = 1
+        else:
+            # Lowest uncovered bit must be covered by some unused piece
+            empty_bits = full_mask ^ board_mask
+            first_empty = (empty_bits & -empty_bits).bit_length() - 1
+            
+            count = 0
+            options = self.cell_placements[first_empty]
+            for piece_idx, piece_mask in options:
+                if used_pieces & (1 << piece_idx) or board_mask & piece_mask:
+                    continue
+                count += self.count_dp(board_mask | piece_mask,
+                                       used_pieces | (1 << piece_idx))
+            
+            if stats is not None:
+                tried = sum(1 for p, _ in options if not used_pieces & (1 << p))
+                overlaps = sum(1 for p, m in options
+                               if not used_pieces & (1 << p) and board_mask & m)
+                stats.tally(depth, tried, overlaps)
+        
+        self.count_memo.put(cache_key, count)
+        return count
+    
+    def count_solutions(self, day: int, month: int, weekday: int,
+                        reset_memo: bool = True) -> int:
+        """Count the solutions for a date without materialising any of them
+        
+        The count memo is date-independent (targets are part of board_mask),
+        so pass reset_memo=False to reuse states proven by earlier dates.
+        """
+        month_abbr = None
+        day_abbr = None
+        
+        for abbr, num in self.months.items():
+            if num == month:
+                month_abbr = abbr
+                break
+        
+        for abbr, num in self.days.items():
+            if num == weekday:
+                day_abbr = abbr
+                break
+        
+        if not month_abbr or not day_abbr:
+            return 0
+        
+        if self.cell_placements is None:
+            self.cell_placements = self.build_cell_placements()
+        
+        print(f"Counting solutions for {day} {month_abbr} {day_abbr} using Dynamic Programming...")
+        
+        # Reset cache unless the caller shares it across dates
+        if reset_memo:
+            self.count_memo.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if self.stats is not None:
+            self.stats.reset()
+        
+        target_mask = self.create_target_mask(day, month_abbr, day_abbr)
+        count = self.count_dp(target_mask, 0)
+        
+        print(f"Counted {count} solution(s) for {day} {month_abbr} {day_abbr}")
+        print(f"Cache stats: {self.cache_hits} hits, {self.cache_misses} misses")
+        
+        return count
+    
     def mask_to_board(self, solutions: List[Dict], target_mask: int) -> List[List[List[int]]]:
         """Convert bit mask solutions back to board representation"""
         board_solutions = []
@@ -347,8 +560,13 @@ class DPCalendarPuzzleSolver:
         
         return board_solutions
     
-    def solve_for_date(self, day: int, month: int, weekday: int) -> List[List[List[int]]]:
-        """Solve puzzle for a specific date using dynamic programming"""
+    def solve_for_date(self, day: int, month: int, weekday: int,
+                       reset_memo: bool = True) -> List[List[List[int]]]:
+        """Solve puzzle for a specific date using dynamic programming
+        
+        Memo entries only depend on (board_mask, used_pieces), never on the
+        date, so reset_memo=False keeps the table from previous dates.
+        """
         # Convert month and weekday to abbreviations
         month_abbr = None
         day_abbr = None
@@ -368,10 +586,13 @@ class DPCalendarPuzzleSolver:
         
         print(f"Solving for {day} {month_abbr} {day_abbr} using Dynamic Programming...")
         
-        # Reset cache for each solve
-        self.memo.clear()
+        # Reset cache unless the caller shares it across dates
+        if reset_memo:
+            self.memo.clear()
         self.cache_hits = 0
         self.cache_misses = 0
+        if self.stats is not None:
+            self.stats.reset()
         
         # Create target mask
         target_mask = self.create_target_mask(day, month_abbr, day_abbr)
@@ -404,14 +625,28 @@ class DPCalendarPuzzleSolver:
         
         return valid_dates
     
-    def solve_all_dates(self) -> Dict[str, List]:
-        """Solve puzzle for all valid dates and return results"""
+    def solve_all_dates(self, jobs: int = 1) -> Dict[str, List]:
+        """Solve puzzle for all valid dates and return results
+        
+        With jobs > 1 the dates are spread over that many worker processes;
+        the result is identical to the serial run.
+        """
         valid_dates = self.generate_valid_dates()
         all_solutions = {}
         
         total_dates = len(valid_dates)
+        
+        if jobs > 1:
+            print(f"Solving for {total_dates} dates using Dynamic Programming on {jobs} processes...")
+            results = solve_dates_in_pool(type(self), valid_dates, jobs, self._options)
+            return solutions_by_date(valid_dates, results, self.months, self.days)
+        
         print(f"Solving for {total_dates} dates using Dynamic Programming...")
         
+        # One transposition table for the whole year: sub-boards proven
+        # (un)solvable for one date are reused by every later date
+        self.memo.clear()
+        
         for i, (day, month, weekday) in enumerate(valid_dates):
             # Create date key
             month_abbr = None
@@ -429,7 +664,7 @@ class DPCalendarPuzzleSolver:
             
             if month_abbr and day_abbr:
                 date_key = f"{day} {month_abbr} {day_abbr}"
-                solutions = self.solve_for_date(day, month, weekday)
+                solutions = self.solve_for_date(day, month, weekday, reset_memo=False)
                 
                 if solutions:
                     # Convert solutions to JSON-friendly format
@@ -440,6 +675,7 @@ class DPCalendarPuzzleSolver:
                 
                 print(f"Progress: {i+1}/{total_dates} ({((i+1)/total_dates*100):.1f}%)")
         
+        self.persist_dead_states()
         return all_solutions
     
     def save_solutions_to_json(self, solutions: Dict, filename: str = "dp_calendar_solutions.json"):
@@ -449,7 +685,17 @@ class DPCalendarPuzzleSolver:
         print(f"Solutions saved to {filename}")
 
 def main():
-    solver = DPCalendarPuzzleSolver()
+    parser = argparse.ArgumentParser(description="Dynamic programming calendar puzzle solver")
+    parser.add_argument("--dead-cache", metavar="PATH",
+                        help="sqlite file of dead states reused across runs")
+    parser.add_argument("--tt-capacity", type=int, metavar="N",
+                        help="bound the transposition table to N entries (default: unbounded)")
+    parser.add_argument("--tt-policy", choices=TranspositionTable.POLICIES, default="lru",
+                        help="eviction policy of a bounded transposition table")
+    args = parser.parse_args()
+    
+    solver = DPCalendarPuzzleSolver(dead_cache=args.dead_cache, tt_capacity=args.tt_capacity,
+                                    tt_policy=args.tt_policy)
     
     print("Starting Dynamic Programming Calendar Puzzle Solver...")
     print("This should be significantly faster than the brute-force approach!")
@@ -471,6 +717,8 @@ def main():
             print("Test completed. Run with all dates when ready!")
     else:
         print("❌ No solutions found for test date. Please check piece definitions.")
+    
+    solver.persist_dead_states()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
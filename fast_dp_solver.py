@@ -4,10 +4,33 @@ Fast calendar-puzzle solver — drop-in replacement for the original
 """
 
 from __future__ import annotations
+import argparse
+import copy
+import functools
+import hashlib
+import itertools
 import json
-from functools import lru_cache
+from array import array
 from datetime import datetime
-from typing import List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict, Iterator, Sequence
+
+from dlx_solver import DancingLinks
+from parallel_solver import (resolve_backend, search_subtrees_in_pool, search_subtrees_in_threads,
+                             solutions_by_date, solve_dates_in_pool, solve_dates_in_threads)
+from search_stats import SearchStats
+from transposition_table import StripedTranspositionTable, TranspositionTable
+from dead_state_cache import DeadStateCache, PersistentTranspositionTable
+from table_cache import code_fingerprint, load_tables, save_tables
+from shared_tables import SharedPlacementTables
+
+
+# definition blob → definition_hash; forked pool workers inherit the parent's
+# entries (a first sha256 call initialises OpenSSL, adding ~1 MB of RSS)
+_definition_hashes: Dict[str, str] = {}
+
+
+class SearchCancelled(Exception):
+    """Raised out of a DFS whose `cancel_check` returned True."""
 
 
 class FastCalendarPuzzleSolver:
@@ -72,9 +95,123 @@ class FastCalendarPuzzleSolver:
          [1, 1]],
     ]
 
+    # search back-ends selectable through ``engine=``
+    #   "dfs" – memoised first-empty-cell DFS, stops at the first tiling
+    #   "dlx" – Dancing Links exact cover, lists every tiling
+    #   "iterative" – the "dfs" search on an explicit preallocated stack
+    #                 (no recursion, same tilings in the same order)
+    ENGINES = ("dfs", "dlx", "iterative")
+
+    # branching-cell choice for the DFS engine, selectable through ``cell_order=``
+    #   "first" – lowest-numbered empty cell (row-major scan)
+    #   "mrv"   – empty cell with the fewest placements still valid
+    #             (minimum remaining values; ties go to the first-empty cell)
+    CELL_ORDERS = ("first", "mrv")
+    # tables built from BOARD and PIECES alone, kept in the on-disk table cache
+    COMPILED_TABLES = ("pos_to_bit", "bit_to_pos", "placements_by_piece", "cell_to_options",
+                       "live_placements_by_piece", "pruned_placements")
+    # methods whose code decides those tables (fingerprinted into the cache key)
+    TABLE_BUILDERS = ("_compile_tables", "_init_derived_tables", "_precompute_placements",
+                      "_gen_orientations", "_rot90", "_flip_h", "_flip_v", "_normalise",
+                      "_prune_placements", "_placement_viable", "_date_groups",
+                      "_build_neighbour_shifts", "_regions", "_grow_region",
+                      "_fillable_sizes")
+
     # ────────────────────────────────────────────────────────────────────────
 
-    def __init__(self) -> None:
+    def __init__(self, engine: str = "dfs", region_pruning: bool = True,
+                 collect_stats: bool = False, cell_order: str = "first",
+                 forward_checking: bool = False, propagate_forced: bool = False,
+                 static_pruning: bool = True, option_table_size: int | None = 4096,
+                 tt_capacity: int | None = None, tt_policy: str = "lru",
+                 dead_cache: str | None = None, table_cache: bool = True,
+                 shared_tables: Dict[str, object] | None = None) -> None:
+        if engine not in self.ENGINES:
+            raise ValueError(f"unknown engine {engine!r}; choose from {self.ENGINES}")
+        if cell_order not in self.CELL_ORDERS:
+            raise ValueError(f"unknown cell order {cell_order!r}; choose from {self.CELL_ORDERS}")
+        if engine == "iterative" and propagate_forced:
+            raise ValueError("propagate_forced is not supported by the iterative engine")
+        self.engine = engine
+        self.cell_order = cell_order
+        # reject boards with an empty region no set of unused pieces can fill
+        self.region_pruning = region_pruning
+        # reject boards where an empty cell or unused piece has no placement left
+        self.forward_checking = forward_checking
+        # commit placements that are a cell's or a piece's only option
+        self.propagate_forced = propagate_forced
+        # search counters for the DFS engines (None = disabled, near-zero cost)
+        self.stats: SearchStats | None = SearchStats() if collect_stats else None
+        # polled at every node of the iter_solutions DFS; returning True raises
+        # SearchCancelled there (nothing half-explored is marked dead)
+        self.cancel_check: Callable[[], bool] | None = None
+        # constructor arguments, replayed when worker processes build a copy
+        self._options: Dict[str, object] = {"engine": engine,
+                                            "region_pruning": region_pruning,
+                                            "collect_stats": collect_stats,
+                                            "cell_order": cell_order,
+                                            "forward_checking": forward_checking,
+                                            "propagate_forced": propagate_forced,
+                                            "static_pruning": static_pruning,
+                                            "option_table_size": option_table_size,
+                                            "tt_capacity": tt_capacity,
+                                            "tt_policy": tt_policy,
+                                            "dead_cache": dead_cache,
+                                            "table_cache": table_cache}
+
+        # board geometry, placements and the search's placement tables; a warm
+        # table cache (see table_cache.py) replaces all of it with one read –
+        # also in every pool worker of solve_all_dates(jobs=N).  shared_tables
+        # is the handle of tables a parent published in shared memory (see
+        # shared_tables.py); they are copied out of the block instead.
+        if shared_tables is not None:
+            tables = self._load_shared_tables(shared_tables)
+        else:
+            kind = "fast" if static_pruning else "fast-unpruned"
+            tables = (load_tables(kind, self.definition_hash(), self.tables_fingerprint())
+                      if table_cache else None)
+            if tables is None:
+                tables = self._compile_tables(static_pruning)
+                if table_cache:
+                    save_tables(kind, self.definition_hash(), self.tables_fingerprint(), tables)
+        for name in self.COMPILED_TABLES:
+            setattr(self, name, tables[name])
+        self._init_derived_tables()
+
+        # (cell, used_mask) → options of unused pieces only, filled lazily and
+        # LRU-bounded by option_table_size (0 = off, None = unbounded)
+        self._unused_options = None
+        if option_table_size != 0:
+            self._unused_options = functools.lru_cache(maxsize=option_table_size)(
+                self._build_unused_options)
+
+        # transposition table: states (packed board_mask << 10 | used_mask)
+        # proven to have no tiling.  Targets are folded into board_mask, so an
+        # entry stays valid for every date and is kept across solve_for_date
+        # calls; tt_capacity bounds it (LRU or clock eviction) for long runs.
+        # With dead_cache (an sqlite path) misses fall back to states proven
+        # by earlier runs and evicted states spill to disk instead of being lost.
+        self.dead_cache = dead_cache
+        if dead_cache is None:
+            self.dead_states = TranspositionTable(tt_capacity, tt_policy)
+        else:
+            self.dead_states = PersistentTranspositionTable(
+                DeadStateCache(dead_cache, self.definition_hash(), preload=tt_capacity is None),
+                tt_capacity, tt_policy)
+
+    def _init_derived_tables(self) -> None:
+        """Cheap tables derived from pos_to_bit (never cached)."""
+        self.total_bits: int = len(self.pos_to_bit)
+        self.valid_mask: int = (1 << self.total_bits) - 1
+        self.all_used_mask: int = (1 << len(self.PIECES)) - 1
+        # flood-fill support: (shift, source-mask) pairs moving every bit onto
+        # each of its orthogonal neighbours, plus piece sizes for region checks
+        self._neighbour_shifts: List[Tuple[int, int]] = self._build_neighbour_shifts()
+        self.piece_sizes: List[int] = [sum(map(sum, piece)) for piece in self.PIECES]
+        self._fillable_cache: Dict[int, int] = {}
+
+    def _compile_tables(self, static_pruning: bool) -> Dict[str, object]:
+        """Build every table in COMPILED_TABLES from BOARD and PIECES."""
         # board geometry → bit positions
         self.pos_to_bit: Dict[Tuple[int, int], int] = {}
         self.bit_to_pos: Dict[int, Tuple[int, int]] = {}
@@ -85,10 +222,7 @@ class FastCalendarPuzzleSolver:
                     self.pos_to_bit[(r, c)] = bit
                     self.bit_to_pos[bit] = (r, c)
                     bit += 1
-
-        self.total_bits: int = bit
-        self.valid_mask: int = (1 << self.total_bits) - 1
-        self.all_used_mask: int = (1 << len(self.PIECES)) - 1
+        self._init_derived_tables()
 
         # generate piece placements
         self.placements_by_piece: List[Tuple[int, ...]] = []
@@ -99,6 +233,47 @@ class FastCalendarPuzzleSolver:
 
         self._precompute_placements()
 
+        # placements the search may use; placements_by_piece keeps every legal
+        # one so its indices (used by the solution store) never shift
+        self.live_placements_by_piece: List[Tuple[int, ...]] = self.placements_by_piece
+        self.pruned_placements = 0
+        if static_pruning:
+            self._prune_placements()
+        return {name: getattr(self, name) for name in self.COMPILED_TABLES}
+
+    def _load_shared_tables(self, handle: Dict[str, object]) -> Dict[str, object]:
+        """COMPILED_TABLES read from a block published by SharedPlacementTables."""
+        if handle["definition_hash"] != self.definition_hash():
+            raise ValueError("shared tables were published for a different puzzle definition")
+        shared = SharedPlacementTables.attach(handle)
+        try:
+            return shared.tables()
+        finally:
+            shared.close()
+
+    def clear_transposition_table(self) -> None:
+        """Forget every dead state learnt by previous searches (in memory)."""
+        self.dead_states.clear()
+
+    def persist_dead_states(self) -> None:
+        """Write the dead states learnt so far to `dead_cache`, if one is set."""
+        if self.dead_cache is not None:
+            self.dead_states.persist()
+
+    @classmethod
+    def tables_fingerprint(cls) -> str:
+        """Hash of the TABLE_BUILDERS code – changes whenever the tables could."""
+        return code_fingerprint(*(getattr(cls, name) for name in cls.TABLE_BUILDERS))
+
+    @classmethod
+    def definition_hash(cls) -> str:
+        """SHA-256 of BOARD and PIECES – changes whenever the puzzle does."""
+        blob = json.dumps([cls.BOARD, cls.PIECES], ensure_ascii=False)
+        digest = _definition_hashes.get(blob)
+        if digest is None:
+            digest = _definition_hashes[blob] = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+        return digest
+
     # ───────────────────────────  GEOMETRY HELPERS  ────────────────────────
     @staticmethod
     def _rot90(mat: List[List[int]]) -> List[List[int]]:
@@ -176,31 +351,595 @@ class FastCalendarPuzzleSolver:
 
             self.placements_by_piece.append(tuple(placements))
 
+    def _placement_viable(self, p_idx: int, placement: int,
+                          group_masks: List[int]) -> bool:
+        """Can `placement` appear in a tiling for at least one date?
+
+        Alone on the board it splits the free cells into regions.  Every
+        tiling leaves one hole per date group, so some assignment of the three
+        holes to regions touching their group must leave each region with a
+        size the other pieces can sum to.
+        """
+        fillable = self._fillable_sizes(1 << p_idx)
+        regions = self._regions(self.valid_mask ^ placement)
+        sizes = [bin(region).count("1") for region in regions]
+        candidates = [[i for i, region in enumerate(regions) if region & group]
+                      for group in group_masks]
+        for holes in itertools.product(*candidates):
+            if all((fillable >> (size - holes.count(i))) & 1
+                   for i, size in enumerate(sizes)):
+                return True
+        return False
+
+    def _prune_placements(self) -> None:
+        """Drop placements no date's tiling can use from the search tables."""
+        _, group_masks = self._date_groups()
+        live = [tuple(pl for pl in placements if self._placement_viable(p_idx, pl, group_masks))
+                for p_idx, placements in enumerate(self.placements_by_piece)]
+        self.pruned_placements = (sum(map(len, self.placements_by_piece))
+                                  - sum(map(len, live)))
+        live_sets = [set(placements) for placements in live]
+        self.cell_to_options = [[(p_idx, pl) for p_idx, pl in options if pl in live_sets[p_idx]]
+                                for options in self.cell_to_options]
+        self.live_placements_by_piece = live
+
+    def _build_unused_options(self, bit: int, used_mask: int) -> Tuple[Tuple[int, int], ...]:
+        """Options covering `bit` whose piece is not in `used_mask`."""
+        return tuple(option for option in self.cell_to_options[bit]
+                     if not used_mask & (1 << option[0]))
+
+    # ──────────────────────────  REGION ANALYSIS  ──────────────────────────
+    def _build_neighbour_shifts(self) -> List[Tuple[int, int]]:
+        """Group neighbour links by bit distance.
+
+        Bits are numbered row-major with blanks skipped, so on this board the
+        distances are ±1 (same row) and ±7 (adjacent row); cells without a
+        neighbour at that distance are left out of the source mask.
+        """
+        sources: Dict[int, int] = {}
+        for (r, c), bit in self.pos_to_bit.items():
+            for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nbit = self.pos_to_bit.get((nr, nc))
+                if nbit is not None:
+                    delta = nbit - bit
+                    sources[delta] = sources.get(delta, 0) | (1 << bit)
+        return sorted(sources.items())
+
+    def _grow_region(self, seed: int, empty: int) -> int:
+        """Connected region of `empty` containing the cells of `seed`."""
+        shifts = self._neighbour_shifts
+        region = seed
+        while True:
+            grown = region
+            for delta, source in shifts:
+                if delta > 0:
+                    grown |= (region & source) << delta
+                else:
+                    grown |= (region & source) >> -delta
+            grown &= empty
+            if grown == region:
+                return region
+            region = grown
+
+    def _regions(self, empty: int) -> List[int]:
+        """Split `empty` into its connected regions (cell masks)."""
+        regions: List[int] = []
+        while empty:
+            region = self._grow_region(empty & -empty, empty)
+            regions.append(region)
+            empty ^= region
+        return regions
+
+    def _fillable_sizes(self, used_mask: int) -> int:
+        """Bitset of region sizes some subset of the unused pieces covers exactly."""
+        sizes = self._fillable_cache.get(used_mask)
+        if sizes is None:
+            sizes = 1
+            for p_idx, size in enumerate(self.piece_sizes):
+                if not used_mask & (1 << p_idx):
+                    sizes |= sizes << size
+            self._fillable_cache[used_mask] = sizes
+        return sizes
+
+    def _has_dead_region(self, board_mask: int, used_mask: int,
+                         hole_groups: Tuple[int, ...] = ()) -> bool:
+        """True if some connected empty region can't be built from unused pieces.
+
+        `hole_groups` are cell masks of date groups (day / month / weekday)
+        that may still leave one cell uncovered; a region touching k of them
+        may be up to k cells larger than the pieces filling it.
+        """
+        empty = self.valid_mask ^ board_mask
+        fillable = self._fillable_sizes(used_mask)
+
+        while empty:
+            region = self._grow_region(empty & -empty, empty)
+            size = bin(region).count("1")
+            if not (fillable >> size) & 1:
+                holes = sum(1 for group in hole_groups if region & group)
+                if not any((fillable >> (size - h)) & 1 for h in range(1, holes + 1)):
+                    return True
+            empty ^= region
+        return False
+
+    def _forward_check_fails(self, board_mask: int, used_mask: int) -> bool:
+        """True if an empty cell or an unused piece has no valid placement left."""
+        empty = self.valid_mask ^ board_mask
+        cell_to_options = self.cell_to_options
+        while empty:
+            low = empty & -empty
+            for p_idx, placement in cell_to_options[low.bit_length() - 1]:
+                if not used_mask & (1 << p_idx) and not placement & board_mask:
+                    break
+            else:
+                return True
+            empty ^= low
+
+        for p_idx, placements in enumerate(self.live_placements_by_piece):
+            if used_mask & (1 << p_idx):
+                continue
+            for placement in placements:
+                if not placement & board_mask:
+                    break
+            else:
+                return True
+        return False
+
+    def _propagate_forced(self, board_mask: int,
+                          used_mask: int) -> List[Tuple[int, int]] | None:
+        """Forced placements from this state, applied until nothing changes.
+
+        A placement is forced when it is the only valid one for an empty cell
+        or for an unused piece.  Returns the forced moves in the order they
+        were committed ([] if none), or None if some cell or piece is left
+        with no valid placement at all.
+        """
+        valid_mask = self.valid_mask
+        cell_to_options = self.cell_to_options
+        forced: List[Tuple[int, int]] = []
+        changed = True
+        while changed and board_mask != valid_mask:
+            changed = False
+
+            empty = valid_mask ^ board_mask
+            while empty:
+                low = empty & -empty
+                only = None
+                n = 0
+                for p_idx, placement in cell_to_options[low.bit_length() - 1]:
+                    if not used_mask & (1 << p_idx) and not placement & board_mask:
+                        n += 1
+                        if n > 1:
+                            break
+                        only = (p_idx, placement)
+                if n == 0:
+                    return None
+                if n == 1:
+                    p_idx, placement = only
+                    board_mask |= placement
+                    used_mask |= 1 << p_idx
+                    forced.append(only)
+                    changed = True
+                    empty &= ~placement
+                else:
+                    empty ^= low
+
+            for p_idx, placements in enumerate(self.live_placements_by_piece):
+                if used_mask & (1 << p_idx):
+                    continue
+                only = None
+                n = 0
+                for placement in placements:
+                    if not placement & board_mask:
+                        n += 1
+                        if n > 1:
+                            break
+                        only = placement
+                if n == 0:
+                    return None
+                if n == 1:
+                    board_mask |= only
+                    used_mask |= 1 << p_idx
+                    forced.append((p_idx, only))
+                    changed = True
+        return forced
+
+    def _mrv_cell(self, board_mask: int, used_mask: int) -> int:
+        """Empty cell with the fewest valid placements (lowest bit on ties)."""
+        empty = self.valid_mask ^ board_mask
+        cell_to_options = self.cell_to_options
+        best_bit, best = -1, 1 << 30
+        while empty:
+            low = empty & -empty
+            bit = low.bit_length() - 1
+            n = 0
+            for p_idx, placement in cell_to_options[bit]:
+                if not used_mask & (1 << p_idx) and not placement & board_mask:
+                    n += 1
+                    if n >= best:
+                        break
+            if n < best:
+                best_bit, best = bit, n
+                if n == 0:
+                    break
+            empty ^= low
+        return best_bit
+
     # ─────────────────────────────  SOLVER CORE  ───────────────────────────
+    @staticmethod
+    def _tally_node(stats: SearchStats, depth: int, options: List[Tuple[int, int]],
+                    board_mask: int, used_mask: int, scanned: int) -> None:
+        """Replay the first `scanned` options of a node into `stats`.
+
+        Only called with stats enabled, so the search loops stay untouched.
+        """
+        tried = overlaps = 0
+        for p_idx, placement in options[:scanned]:
+            if used_mask & (1 << p_idx):
+                continue
+            tried += 1
+            if placement & board_mask:
+                overlaps += 1
+        stats.tally(depth, tried, overlaps)
+
     def _solve_mask(self, initial_mask: int) -> List[Tuple[int, int]] | None:
         """Return list[(piece_idx, placement_mask)] or None."""
         solution: List[Tuple[int, int]] = []
+        dead_states = self.dead_states
+        used_bits = len(self.PIECES)
+        region_pruning = self.region_pruning
+        forward_checking = self.forward_checking
+        propagate = self.propagate_forced
+        unused_options = self._unused_options
+        mrv = self.cell_order == "mrv"
+        stats = self.stats
 
-        @lru_cache(maxsize=None)
         def dfs(board_mask: int, used_mask: int) -> bool:
             if board_mask == self.valid_mask:
                 return True        # everything covered (target + pieces)
+            if stats is not None:
+                depth = bin(used_mask).count("1")
+                stats.enter(depth)
+            key = board_mask << used_bits | used_mask
+            if key in dead_states:
+                if stats is not None:
+                    stats.memo_hits += 1
+                return False
+            if stats is not None:
+                stats.memo_misses += 1
+            if region_pruning and self._has_dead_region(board_mask, used_mask):
+                if stats is not None:
+                    stats.region_prunes += 1
+                dead_states.add(key)
+                return False
+            if forward_checking and self._forward_check_fails(board_mask, used_mask):
+                if stats is not None:
+                    stats.forward_check_prunes += 1
+                dead_states.add(key)
+                return False
+            forced: List[Tuple[int, int]] | None = []
+            if propagate:
+                forced = self._propagate_forced(board_mask, used_mask)
+                if forced is None:
+                    if stats is not None:
+                        stats.forward_check_prunes += 1
+                    dead_states.add(key)
+                    return False
+                if forced:
+                    if stats is not None:
+                        stats.forced_moves += len(forced)
+                    entry_state = key
+                    for p_idx, placement in forced:
+                        board_mask |= placement
+                        used_mask |= 1 << p_idx
+                    if board_mask == self.valid_mask:
+                        solution.extend(reversed(forced))
+                        return True
+                    key = board_mask << used_bits | used_mask
+                    if key in dead_states:
+                        dead_states.add(entry_state)
+                        return False
 
-            # first empty cell (LSB zero in board_mask)
-            empty_bits = self.valid_mask ^ board_mask
-            first_empty_bit = (empty_bits & -empty_bits).bit_length() - 1
+            if mrv:
+                branch_bit = self._mrv_cell(board_mask, used_mask)
+            else:
+                # first empty cell (LSB zero in board_mask)
+                empty_bits = self.valid_mask ^ board_mask
+                branch_bit = (empty_bits & -empty_bits).bit_length() - 1
+            hit = None
+            if unused_options is None:
+                options = self.cell_to_options[branch_bit]
+                for p_idx, placement in options:
+                    if used_mask & (1 << p_idx):
+                        continue
+                    if placement & board_mask:
+                        continue
+                    if dfs(board_mask | placement, used_mask | (1 << p_idx)):
+                        hit = (p_idx, placement)
+                        break
+            else:
+                # already restricted to unused pieces: only the overlap test is left
+                options = unused_options(branch_bit, used_mask)
+                for p_idx, placement in options:
+                    if placement & board_mask:
+                        continue
+                    if dfs(board_mask | placement, used_mask | (1 << p_idx)):
+                        hit = (p_idx, placement)
+                        break
+            if hit is not None:
+                solution.append(hit)
+                if forced:
+                    solution.extend(reversed(forced))
+                if stats is not None:
+                    scanned = options.index(hit) + 1
+                    self._tally_node(stats, depth, options, board_mask, used_mask, scanned)
+                return True
+            if stats is not None:
+                self._tally_node(stats, depth, options, board_mask, used_mask, len(options))
+            dead_states.add(key)
+            if forced:
+                dead_states.add(entry_state)
+            return False
 
-            for p_idx, placement in self.cell_to_options[first_empty_bit]:
-                if used_mask & (1 << p_idx):
+        return solution[::-1] if dfs(initial_mask, 0) else None
+
+    def _iter_mask(self, initial_mask: int,
+                   initial_used: int = 0) -> Iterator[List[Tuple[int, int]]]:
+        """Yield every tiling as list[(piece_idx, placement_mask)], lazily.
+
+        Same DFS and cell order as `_solve_mask`, so the first tiling yielded
+        is the one `_solve_mask` returns.  A subtree is recorded in
+        `dead_states` only once it has been exhausted without a tiling; if the
+        caller stops early nothing half-explored is marked dead.  Starting
+        from a state with pieces already placed (`initial_used`) yields only
+        the moves made below it.
+        """
+        moves: List[Tuple[int, int]] = []
+        dead_states = self.dead_states
+        used_bits = len(self.PIECES)
+        valid_mask = self.valid_mask
+        cell_to_options = self.cell_to_options
+        unused_options = self._unused_options
+        region_pruning = self.region_pruning
+        forward_checking = self.forward_checking
+        propagate = self.propagate_forced
+        mrv = self.cell_order == "mrv"
+        stats = self.stats
+        cancel_check = self.cancel_check
+
+        def walk(board_mask: int, used_mask: int) -> Iterator[List[Tuple[int, int]]]:
+            if board_mask == valid_mask:
+                yield list(moves)
+                return
+            if cancel_check is not None and cancel_check():
+                raise SearchCancelled
+            if stats is not None:
+                depth = bin(used_mask).count("1")
+                stats.enter(depth)
+            key = board_mask << used_bits | used_mask
+            if key in dead_states:
+                if stats is not None:
+                    stats.memo_hits += 1
+                return
+            if stats is not None:
+                stats.memo_misses += 1
+            if region_pruning and self._has_dead_region(board_mask, used_mask):
+                if stats is not None:
+                    stats.region_prunes += 1
+                dead_states.add(key)
+                return
+            if forward_checking and self._forward_check_fails(board_mask, used_mask):
+                if stats is not None:
+                    stats.forward_check_prunes += 1
+                dead_states.add(key)
+                return
+            forced: List[Tuple[int, int]] | None = []
+            if propagate:
+                forced = self._propagate_forced(board_mask, used_mask)
+                if forced is None:
+                    if stats is not None:
+                        stats.forward_check_prunes += 1
+                    dead_states.add(key)
+                    return
+                if forced:
+                    if stats is not None:
+                        stats.forced_moves += len(forced)
+                    entry_state = key
+                    for p_idx, placement in forced:
+                        board_mask |= placement
+                        used_mask |= 1 << p_idx
+                    moves.extend(forced)
+                    if board_mask == valid_mask:
+                        yield list(moves)
+                        del moves[-len(forced):]
+                        return
+                    key = board_mask << used_bits | used_mask
+                    if key in dead_states:
+                        del moves[-len(forced):]
+                        dead_states.add(entry_state)
+                        return
+
+            if mrv:
+                branch_bit = self._mrv_cell(board_mask, used_mask)
+            else:
+                empty_bits = valid_mask ^ board_mask
+                branch_bit = (empty_bits & -empty_bits).bit_length() - 1
+
+            found = False
+            if unused_options is None:
+                options = cell_to_options[branch_bit]
+                for p_idx, placement in options:
+                    if used_mask & (1 << p_idx) or placement & board_mask:
+                        continue
+                    moves.append((p_idx, placement))
+                    for tiling in walk(board_mask | placement, used_mask | (1 << p_idx)):
+                        found = True
+                        yield tiling
+                    moves.pop()
+            else:
+                # already restricted to unused pieces: only the overlap test is left
+                options = unused_options(branch_bit, used_mask)
+                for p_idx, placement in options:
+                    if placement & board_mask:
+                        continue
+                    moves.append((p_idx, placement))
+                    for tiling in walk(board_mask | placement, used_mask | (1 << p_idx)):
+                        found = True
+                        yield tiling
+                    moves.pop()
+            if stats is not None:
+                self._tally_node(stats, depth, options, board_mask, used_mask, len(options))
+            if forced:
+                del moves[-len(forced):]
+            if not found:
+                dead_states.add(key)
+                if forced:
+                    dead_states.add(entry_state)
+
+        yield from walk(initial_mask, initial_used)
+
+    def _iter_mask_iterative(self, initial_mask: int) -> Iterator[List[Tuple[int, int]]]:
+        """`_iter_mask` without recursion: same tilings, same order.
+
+        Level d of the explicit stack is the state with d pieces placed.  Its
+        next option index and found flag live in arrays, its masks and option
+        tuple in plain lists (reading a mask back out of an array would box a
+        fresh int), all sized once per call; the loop itself creates no
+        frames or closures, and stack depth is bounded by the piece count
+        rather than the interpreter's recursion limit.
+        """
+        n_levels = len(self.PIECES) + 1
+        boards = [0] * n_levels
+        useds = [0] * n_levels
+        nexts = array("H", bytes(2 * n_levels))
+        found = array("b", bytes(n_levels))
+        opts: List[Sequence[Tuple[int, int]]] = [()] * n_levels
+
+        dead_states = self.dead_states
+        used_bits = len(self.PIECES)
+        valid_mask = self.valid_mask
+        cell_to_options = self.cell_to_options
+        unused_options = self._unused_options
+        region_pruning = self.region_pruning
+        forward_checking = self.forward_checking
+        mrv = self.cell_order == "mrv"
+        stats = self.stats
+        cancel_check = self.cancel_check
+
+        boards[0] = initial_mask
+        depth = 0
+        entering = True
+        while depth >= 0:
+            board_mask = boards[depth]
+            used_mask = useds[depth]
+
+            if entering:
+                entering = False
+                if board_mask == valid_mask:
+                    yield [opts[d][nexts[d] - 1] for d in range(depth)]
+                    found[depth - 1] = 1
+                    depth -= 1
                     continue
-                if placement & board_mask:
+                if cancel_check is not None and cancel_check():
+                    raise SearchCancelled
+                if stats is not None:
+                    stats.enter(depth)
+                pruned = True
+                key = board_mask << used_bits | used_mask
+                if key in dead_states:
+                    if stats is not None:
+                        stats.memo_hits += 1
+                    pruned = False          # already recorded
+                elif region_pruning and self._has_dead_region(board_mask, used_mask):
+                    if stats is not None:
+                        stats.memo_misses += 1
+                        stats.region_prunes += 1
+                elif forward_checking and self._forward_check_fails(board_mask, used_mask):
+                    if stats is not None:
+                        stats.memo_misses += 1
+                        stats.forward_check_prunes += 1
+                else:
+                    if stats is not None:
+                        stats.memo_misses += 1
+                    if mrv:
+                        branch_bit = self._mrv_cell(board_mask, used_mask)
+                    else:
+                        empty_bits = valid_mask ^ board_mask
+                        branch_bit = (empty_bits & -empty_bits).bit_length() - 1
+                    if unused_options is None:
+                        opts[depth] = cell_to_options[branch_bit]
+                    else:
+                        opts[depth] = unused_options(branch_bit, used_mask)
+                    nexts[depth] = 0
+                    found[depth] = 0
+                    pruned = None
+                if pruned is not None:
+                    if pruned:
+                        dead_states.add(key)
+                    depth -= 1
                     continue
-                if dfs(board_mask | placement, used_mask | (1 << p_idx)):
-                    solution.append((p_idx, placement))
-                    return True
-            return False
 
-        return solution[::-1] if dfs(initial_mask, 0) else None
+            # advance this level to its next fitting option
+            options = opts[depth]
+            n_options = len(options)
+            for i in range(nexts[depth], n_options):
+                p_idx, placement = options[i]
+                if placement & board_mask or used_mask & (1 << p_idx):
+                    continue
+                nexts[depth] = i + 1
+                boards[depth + 1] = board_mask | placement
+                useds[depth + 1] = used_mask | (1 << p_idx)
+                depth += 1
+                entering = True
+                break
+            else:
+                # level exhausted
+                if stats is not None:
+                    self._tally_node(stats, depth, options, board_mask, used_mask, n_options)
+                if found[depth]:
+                    if depth:
+                        found[depth - 1] = 1
+                else:
+                    dead_states.add(board_mask << used_bits | used_mask)
+                depth -= 1
+
+    def _iter_mask_dlx(self, initial_mask: int) -> Iterator[List[Tuple[int, int]]]:
+        """Yield every tiling of the free cells as list[(piece_idx, placement_mask)].
+
+        Exact-cover columns: one per free cell (bits clear in `initial_mask`)
+        followed by one per piece, so each piece is used exactly once.
+        """
+        free_bits = [bit for bit in range(self.total_bits)
+                     if not initial_mask & (1 << bit)]
+        bit_to_col = {bit: col for col, bit in enumerate(free_bits)}
+        piece_col0 = len(free_bits)
+
+        rows: List[List[int]] = []
+        moves: List[Tuple[int, int]] = []
+        for p_idx, placements in enumerate(self.live_placements_by_piece):
+            for placement in placements:
+                if placement & initial_mask:
+                    continue
+                cols = [bit_to_col[bit] for bit in free_bits if placement & (1 << bit)]
+                cols.append(piece_col0 + p_idx)
+                rows.append(cols)
+                moves.append((p_idx, placement))
+
+        cancel_check = self.cancel_check
+        stats = self.stats
+
+        def on_node(depth: int, branches: int) -> None:
+            if stats is not None:
+                # every row of the branching column fits: no overlaps to reject
+                stats.enter(depth)
+                stats.tally(depth, branches, 0)
+            if cancel_check is not None and cancel_check():
+                raise SearchCancelled
+
+        matrix = DancingLinks(piece_col0 + len(self.PIECES), rows)
+        hooked = cancel_check is not None or stats is not None
+        for cover in matrix.solutions(on_node if hooked else None):
+            yield [moves[r] for r in sorted(cover, key=lambda r: moves[r][0])]
 
     # ────────────────────────────  PUBLIC API  ─────────────────────────────
     def _target_mask(self, day: int, month_abbr: str, day_abbr: str) -> int:
@@ -213,6 +952,12 @@ class FastCalendarPuzzleSolver:
                 target |= 1 << bit
         return target
 
+    def _date_target(self, day: int, month: int, weekday: int) -> int:
+        """`_target_mask` for a date given as numbers (month 1-12, weekday 1-7)."""
+        month_abbr = next(k for k, v in self.MONTHS.items() if v == month)
+        day_abbr = next(k for k, v in self.DAYS.items() if v == weekday)
+        return self._target_mask(day, month_abbr, day_abbr)
+
     def _mask_to_board(self, moves: List[Tuple[int, int]], target: int) -> List[List[int]]:
         board = [[-2 if not cell else 0] for cell in []]  # dummy for editor lint
         # build fresh board each call
@@ -237,15 +982,304 @@ class FastCalendarPuzzleSolver:
 
     # ─────────────────────────────  USER FACING  ───────────────────────────
     def solve_for_date(self, day: int, month: int, weekday: int) -> List[List[List[int]]]:
-        month_abbr = next(k for k, v in self.MONTHS.items() if v == month)
-        day_abbr = next(k for k, v in self.DAYS.items() if v == weekday)
+        if self.engine == "dlx":
+            return list(self.iter_solutions(day, month, weekday))
+
+        if self.stats is not None:
+            self.stats.reset()
 
-        target = self._target_mask(day, month_abbr, day_abbr)
-        moves = self._solve_mask(target)
+        target = self._date_target(day, month, weekday)
+
+        if self.engine == "iterative":
+            moves = next(self._iter_mask_iterative(target), None)
+        else:
+            moves = self._solve_mask(target)
         if moves is None:
             return []
         return [self._mask_to_board(moves, target)]
 
+    def iter_solutions(self, day: int, month: int, weekday: int) -> Iterator[List[List[int]]]:
+        """Yield every solution board for the date, one at a time, as found.
+
+        Nothing is accumulated, so callers can stop early, page through the
+        results or stream them to disk.  The "dlx" engine yields from Dancing
+        Links, the other engines from the memoised DFS.
+        """
+        target = self._date_target(day, month, weekday)
+        if self.stats is not None:
+            self.stats.reset()
+        if self.engine == "dlx":
+            tilings = self._iter_mask_dlx(target)
+        elif self.engine == "iterative":
+            tilings = self._iter_mask_iterative(target)
+        else:
+            tilings = self._iter_mask(target)
+        for moves in tilings:
+            yield self._mask_to_board(moves, target)
+
+    # ──────────────────────  ONE DATE ACROSS PROCESSES  ────────────────────
+    def _split_frontier(self, initial_mask: int, depth: int
+                        ) -> List[Tuple[List[Tuple[int, int]], int, int]]:
+        """Search states `depth` placements below the root, in DFS order.
+
+        Each entry is (moves so far, board_mask, used_mask).  Branching
+        follows `_iter_mask` (same cell order, same option order), so
+        searching the entries one after another yields the tilings in the
+        serial order.  Branches the region check rules out are dropped; a
+        complete tiling found above `depth` is kept as its own entry.
+        """
+        frontier: List[Tuple[List[Tuple[int, int]], int, int]] = []
+        moves: List[Tuple[int, int]] = []
+
+        def expand(board_mask: int, used_mask: int, level: int) -> None:
+            if level == depth or board_mask == self.valid_mask:
+                frontier.append((list(moves), board_mask, used_mask))
+                return
+            if self.region_pruning and self._has_dead_region(board_mask, used_mask):
+                return
+            if self.cell_order == "mrv":
+                branch_bit = self._mrv_cell(board_mask, used_mask)
+            else:
+                empty_bits = self.valid_mask ^ board_mask
+                branch_bit = (empty_bits & -empty_bits).bit_length() - 1
+            for p_idx, placement in self.cell_to_options[branch_bit]:
+                if used_mask & (1 << p_idx) or placement & board_mask:
+                    continue
+                moves.append((p_idx, placement))
+                expand(board_mask | placement, used_mask | (1 << p_idx), level + 1)
+                moves.pop()
+
+        expand(initial_mask, 0, 0)
+        return frontier
+
+    def _thread_view_factory(self) -> Callable[[], "FastCalendarPuzzleSolver"]:
+        """Factory of per-thread solvers for the thread backend.
+
+        Each view shares this solver's compiled and option tables and one
+        StripedTranspositionTable (dead states are monotonic, so any thread
+        may use any other's); stats are off, and a dead_cache is not used.
+        """
+        shared = StripedTranspositionTable(self._options["tt_capacity"],
+                                           self._options["tt_policy"])
+
+        def make_view() -> FastCalendarPuzzleSolver:
+            view = copy.copy(self)
+            view.dead_states = shared
+            view.dead_cache = None
+            view.stats = None
+            return view
+        return make_view
+
+    def date_frontier(self, day: int, month: int, weekday: int, split_depth: int
+                      ) -> List[Tuple[List[Tuple[int, int]], int, int]]:
+        """(moves, board_mask, used_mask) states `split_depth` deep for a date,
+        in serial search order; see `search_subtree` to search one."""
+        return self._split_frontier(self._date_target(day, month, weekday), split_depth)
+
+    def search_subtree(self, board_mask: int, used_mask: int,
+                       count_only: bool = False) -> List[List[Tuple[int, int]]] | int:
+        """Tilings (moves below the state) or their number for one search state."""
+        tilings = self._iter_mask(board_mask, used_mask)
+        if count_only:
+            return sum(1 for _ in tilings)
+        return list(tilings)
+
+    def solve_date_split(self, day: int, month: int, weekday: int, jobs: int = 2,
+                         mode: str = "solutions", split_depth: int = 2,
+                         backend: str = "auto") -> List[List[List[int]]] | int:
+        """Every solution board (mode "solutions") or their number (mode
+        "count") for one date, with its search tree split across processes.
+
+        The tree is expanded `split_depth` placements deep; each state there
+        is searched by a pool worker, which takes the next state as soon as
+        it finishes one, so unbalanced subtrees keep every worker busy.
+        Results are merged in frontier order: the same solutions, in the same
+        order, as `iter_solutions` (the order may differ with
+        propagate_forced or the dlx engine, whose trees are shaped
+        differently).  `backend` is as for `solve_all_dates`.
+        """
+        if mode not in ("solutions", "count"):
+            raise ValueError(f"unknown mode {mode!r}; choose 'solutions' or 'count'")
+        target = self._date_target(day, month, weekday)
+        frontier = self._split_frontier(target, split_depth)
+        states = [(board, used) for _, board, used in frontier]
+        if resolve_backend(backend) == "thread":
+            results = search_subtrees_in_threads(self._thread_view_factory(), states, jobs,
+                                                 count_only=mode == "count")
+        else:
+            results = search_subtrees_in_pool(type(self), states, jobs, self._options,
+                                              count_only=mode == "count")
+        if mode == "count":
+            return sum(results)
+        return [self._mask_to_board(prefix + moves, target)
+                for (prefix, _, _), tilings in zip(frontier, results)
+                for moves in tilings]
+
+    # ─────────────────────  WHOLE-CALENDAR SINGLE PASS  ────────────────────
+    def _date_groups(self) -> Tuple[List[int], List[int]]:
+        """Per-bit group (0 day, 1 month, 2 weekday, -1 other) and group masks."""
+        day_labels = {str(d) for d in range(1, 32)}
+        cell_group = [-1] * self.total_bits
+        group_masks = [0, 0, 0]
+        for (r, c), bit in self.pos_to_bit.items():
+            label = self.BOARD[r][c]
+            if label in day_labels:
+                group = 0
+            elif label in self.MONTHS:
+                group = 1
+            elif label in self.DAYS:
+                group = 2
+            else:
+                continue
+            cell_group[bit] = group
+            group_masks[group] |= 1 << bit
+        return cell_group, group_masks
+
+    def solve_all_triples(self, memo_depth: int | None = None,
+                          dates: Optional[Sequence[Tuple[int, int, int]]] = None
+                          ) -> Dict[Tuple[int, int, int], Dict[str, object]]:
+        """Solve every (day, month, weekday) combination in one search.
+
+        Instead of one search per date, a single DFS tiles the board while
+        leaving exactly one day, one month and one weekday cell uncovered:
+        at the first empty cell it may either place a piece or, if the cell
+        belongs to a date group that has no hole yet, leave it open.  Every
+        state memoises its subtree's tiling counts bucketed by the holes it
+        chose ({holes_mask: count}; a plain int once all three holes are
+        fixed), so all 31×12×7 counts come out of one pass.  A sample board
+        per solvable bucket is then read off the memo by following, from the
+        root, the first option whose subtree still counts that bucket: the
+        first tiling in DFS order, i.e. the board `solve_for_date` returns,
+        without searching again.
+
+        The memo holds tens of millions of states (about 3 GB for this
+        board); `memo_depth` skips memoising dead states with more than that
+        many pieces placed, trading time for memory (6 roughly halves both).
+        `dates` limits the holes to cells those dates leave open, so only
+        their combinations are searched (and returned).
+
+        Returns {(day, month, weekday): {"count": n, "board_state": board|None}}.
+        """
+        valid_mask = self.valid_mask
+        cell_to_options = self.cell_to_options
+        region_pruning = self.region_pruning
+        cell_group, group_masks = self._date_groups()
+        if dates is None:
+            dates = [(day, month, weekday) for day in range(1, 32)
+                     for month in self.MONTHS.values() for weekday in self.DAYS.values()]
+        else:
+            allowed = 0
+            for date in dates:
+                allowed |= self._date_target(*date)
+            cell_group = [g if allowed >> bit & 1 else -1 for bit, g in enumerate(cell_group)]
+            group_masks = [m & allowed for m in group_masks]
+        all_groups = (1 << len(group_masks)) - 1
+        n_pieces = len(self.PIECES)
+        keep_dead = [memo_depth is None or bin(u).count("1") <= memo_depth
+                     for u in range(1 << n_pieces)]
+        memo: Dict[int, object] = {}
+        dead: Dict[int, int] = {}                 # shared empty bucket dict
+
+        def merge(result: Dict[int, int], sub: object, hole: int) -> None:
+            if isinstance(sub, int):
+                if sub:
+                    result[hole] = result.get(hole, 0) + sub
+            else:
+                for holes, n in sub.items():
+                    holes |= hole
+                    result[holes] = result.get(holes, 0) + n
+
+        def count(board_mask: int, used_mask: int, groups: int) -> object:
+            if board_mask == valid_mask:
+                return 1
+            key = ((board_mask << n_pieces) | used_mask) << 3 | groups
+            result = memo.get(key)
+            if result is not None:
+                return result
+
+            empty_bits = valid_mask ^ board_mask
+            low = empty_bits & -empty_bits
+            first_empty_bit = low.bit_length() - 1
+
+            if groups == all_groups:
+                # holes all fixed: plain tiling count
+                if region_pruning and self._has_dead_region(board_mask, used_mask):
+                    total = 0
+                else:
+                    total = 0
+                    for p_idx, placement in cell_to_options[first_empty_bit]:
+                        if used_mask & (1 << p_idx) or placement & board_mask:
+                            continue
+                        total += count(board_mask | placement, used_mask | (1 << p_idx), groups)
+                if total or keep_dead[used_mask]:
+                    memo[key] = total
+                return total
+
+            buckets: Dict[int, int] = {}
+            open_groups = tuple(m for g, m in enumerate(group_masks) if not groups & (1 << g))
+            if not (region_pruning and
+                    self._has_dead_region(board_mask, used_mask, open_groups)):
+                for p_idx, placement in cell_to_options[first_empty_bit]:
+                    if used_mask & (1 << p_idx) or placement & board_mask:
+                        continue
+                    merge(buckets, count(board_mask | placement,
+                                         used_mask | (1 << p_idx), groups), 0)
+
+                group = cell_group[first_empty_bit]
+                if group >= 0 and not groups & (1 << group):
+                    merge(buckets, count(board_mask | low, used_mask,
+                                         groups | (1 << group)), low)
+
+            if not buckets:
+                buckets = dead
+                if not keep_dead[used_mask]:
+                    return buckets
+            memo[key] = buckets
+            return buckets
+
+        def stored(board_mask: int, used_mask: int, groups: int) -> object:
+            # only states without tilings are ever left out of the memo
+            if board_mask == valid_mask:
+                return 1
+            return memo.get(((board_mask << n_pieces) | used_mask) << 3 | groups, 0)
+
+        def witness(target: int) -> List[Tuple[int, int]]:
+            moves: List[Tuple[int, int]] = []
+            board_mask = used_mask = groups = 0
+            holes = target                        # holes still to leave open
+            while board_mask != valid_mask:
+                empty_bits = valid_mask ^ board_mask
+                low = empty_bits & -empty_bits
+                bit = low.bit_length() - 1
+                if low & holes:
+                    board_mask |= low
+                    holes ^= low
+                    groups |= 1 << cell_group[bit]
+                    continue
+                for p_idx, placement in cell_to_options[bit]:
+                    if used_mask & (1 << p_idx) or placement & board_mask:
+                        continue
+                    sub = stored(board_mask | placement, used_mask | (1 << p_idx), groups)
+                    if sub.get(holes) if isinstance(sub, dict) else sub and not holes:
+                        break
+                moves.append((p_idx, placement))
+                board_mask |= placement
+                used_mask |= 1 << p_idx
+            return moves
+
+        root = count(0, 0, 0)
+
+        results: Dict[Tuple[int, int, int], Dict[str, object]] = {}
+        for date in dates:
+            target = self._date_target(*date)
+            n = root.get(target, 0) if isinstance(root, dict) else 0
+            board = None
+            if n:
+                board = self._mask_to_board(witness(target), target)
+            results[date] = {"count": n, "board_state": board}
+        memo.clear()
+        return results
+
     # exhaustively solve 2024
     def _valid_dates(self) -> List[Tuple[int, int, int]]:
         out = []
@@ -255,16 +1289,31 @@ class FastCalendarPuzzleSolver:
                 out.append((d, m, wd))
         return out
 
-    def solve_all_dates(self) -> Dict[str, List]:
-        res: Dict[str, List] = {}
-        for day, month, wd in self._valid_dates():
-            month_abbr = next(k for k, v in self.MONTHS.items() if v == month)
-            day_abbr = next(k for k, v in self.DAYS.items() if v == wd)
-            key = f"{day} {month_abbr} {day_abbr}"
-            sols = self.solve_for_date(day, month, wd)
-            if sols:
-                res[key] = [{"solution_id": 0, "board_state": sols[0]}]
-        return res
+    def solve_all_dates(self, jobs: int = 1, backend: str = "auto",
+                        shared_tables: bool = False) -> Dict[str, List]:
+        """Solve every date of the year; `jobs` > 1 spreads dates over workers.
+
+        `backend` "process" uses a process pool, "thread" a thread pool
+        sharing this solver's tables and one lock-striped transposition
+        table; "auto" picks threads only when the GIL is disabled.  Process
+        workers read their compiled tables from the table cache, or with
+        `shared_tables` copy them from this solver's tables published once in
+        shared memory (threads share them anyway).
+        """
+        dates = self._valid_dates()
+        backend = resolve_backend(backend)
+        if jobs > 1 and backend == "thread":
+            all_sols = solve_dates_in_threads(self._thread_view_factory(), dates, jobs)
+        elif jobs > 1 and shared_tables:
+            with SharedPlacementTables.publish(self) as shared:
+                all_sols = solve_dates_in_pool(type(self), dates, jobs,
+                                               {**self._options, "shared_tables": shared.handle})
+        elif jobs > 1:
+            all_sols = solve_dates_in_pool(type(self), dates, jobs, self._options)
+        else:
+            all_sols = [self.solve_for_date(day, month, wd) for day, month, wd in dates]
+            self.persist_dead_states()
+        return solutions_by_date(dates, all_sols, self.MONTHS, self.DAYS)
 
     def save_solutions_to_json(self, solutions: Dict, filename: str = "dp_calendar_solutions.json") -> None:
         with open(filename, "w", encoding="utf-8") as fh:
@@ -273,7 +1322,17 @@ class FastCalendarPuzzleSolver:
 
 # ────────────────────────────  CLI HARNESS  ───────────────────────────────
 def main() -> None:
-    solver = FastCalendarPuzzleSolver()
+    parser = argparse.ArgumentParser(description="Fast calendar puzzle solver")
+    parser.add_argument("--dead-cache", metavar="PATH",
+                        help="sqlite file of dead states reused across runs")
+    parser.add_argument("--tt-capacity", type=int, metavar="N",
+                        help="bound the transposition table to N entries (default: unbounded)")
+    parser.add_argument("--tt-policy", choices=TranspositionTable.POLICIES, default="lru",
+                        help="eviction policy of a bounded transposition table")
+    args = parser.parse_args()
+
+    solver = FastCalendarPuzzleSolver(dead_cache=args.dead_cache, tt_capacity=args.tt_capacity,
+                                      tt_policy=args.tt_policy)
 
     print("Fast Calendar Puzzle Solver")
     print("Testing 1 January 2024 …")
@@ -287,6 +1346,7 @@ def main() -> None:
         all_solutions = solver.solve_all_dates()
         solver.save_solutions_to_json(all_solutions)
         print(f"Done!  Solutions for {len(all_solutions)} distinct dates written to JSON.")
+    solver.persist_dead_states()
 
 
 if __name__ == "__main__":
@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 
+import hashlib
 import json
 import copy
 from typing import List, Tuple, Dict, Set
 from datetime import datetime
 import time
 
+from search_stats import SearchStats
+from transposition_table import TranspositionTable, pack_state
+from table_cache import code_fingerprint, load_tables, save_tables
+
 class OptimizedDPSolver:
-    def __init__(self):
+    def __init__(self, collect_stats=False, tt_capacity=None, tt_policy="lru",
+                 verbose=True, table_cache=True):
         # Game board layout
         self.board = [
             ["1",  "2",  "3",  "4",  "OCA", "♥",  "PZT"],   # Row 0
@@ -47,31 +53,34 @@ class OptimizedDPSolver:
         self.board_height = len(self.board)
         self.board_width = len(self.board[0])
         
-        # Create position mapping for valid cells only
-        self.valid_positions = []
-        self.pos_to_index = {}
-        
-        for r in range(self.board_height):
-            for c in range(self.board_width):
-                if self.board[r][c] != "":  # Valid position
-                    index = len(self.valid_positions)
-                    self.valid_positions.append((r, c))
-                    self.pos_to_index[(r, c)] = index
-        
+        # Cell indices and every placement of every piece; a warm table cache
+        # (see table_cache.py) replaces building them with one file read
+        fingerprint = self.tables_fingerprint()
+        tables = load_tables("optimized", self.definition_hash(), fingerprint) if table_cache else None
+        if tables is None:
+            tables = self.compile_tables()
+            if table_cache:
+                save_tables("optimized", self.definition_hash(), fingerprint, tables)
+        self.valid_positions = tables["valid_positions"]
+        self.pos_to_index = tables["pos_to_index"]
+        self.piece_placements = tables["piece_placements"]
         self.total_positions = len(self.valid_positions)
-        print(f"Total valid positions: {self.total_positions}")
         
-        # Pre-compute piece placements
-        self.piece_placements = []
-        for piece_idx, piece in enumerate(self.pieces):
-            placements = self.compute_piece_placements(piece)
-            self.piece_placements.append(placements)
-            print(f"Piece {piece_idx + 1}: {len(placements)} possible placements")
-        
-        # Memoization
-        self.memo = {}
+        # Print table sizes only when asked (pool workers and tools stay quiet)
+        self.verbose = verbose
+        if verbose:
+            print(f"Total valid positions: {self.total_positions}")
+            for piece_idx, placements in enumerate(self.piece_placements):
+                print(f"Piece {piece_idx + 1}: {len(placements)} possible placements")
+        
+        # Memoization: packed (covered_mask, used_pieces) -> solutions,
+        # optionally capped at tt_capacity entries (LRU or clock eviction)
+        self.memo = TranspositionTable(tt_capacity, tt_policy)
         self.cache_hits = 0
         self.cache_misses = 0
+        
+        # Detailed search counters (None when disabled)
+        self.stats = SearchStats() if collect_stats else None
     
     def rotate_90(self, piece):
         """Rotate piece 90 degrees clockwise"""
@@ -112,6 +121,38 @@ class OptimizedDPSolver:
                     positions.append((i, j))
         return positions
     
+    def definition_hash(self):
+        """SHA-256 of the board and pieces (keys the compiled-table cache)"""
+        blob = json.dumps([self.board, self.pieces], ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+    
+    def tables_fingerprint(self):
+        """Hash of the code building the cached tables"""
+        return code_fingerprint(
+            self.compile_tables, self.compute_piece_placements, self.generate_orientations,
+            self.rotate_90, self.flip_horizontal, self.piece_to_positions)
+    
+    def compile_tables(self):
+        """Build the tables cached by table_cache from the board and pieces"""
+        # Create position mapping for valid cells only
+        self.valid_positions = []
+        self.pos_to_index = {}
+        
+        for r in range(self.board_height):
+            for c in range(self.board_width):
+                if self.board[r][c] != "":  # Valid position
+                    index = len(self.valid_positions)
+                    self.valid_positions.append((r, c))
+                    self.pos_to_index[(r, c)] = index
+        
+        # Pre-compute piece placements
+        piece_placements = [self.compute_piece_placements(piece) for piece in self.pieces]
+        return {
+            "valid_positions": self.valid_positions,
+            "pos_to_index": self.pos_to_index,
+            "piece_placements": piece_placements,
+        }
+    
     def compute_piece_placements(self, piece):
         """Compute all valid placements for a piece"""
         placements = []
@@ -180,13 +221,23 @@ class OptimizedDPSolver:
     def solve_recursive(self, covered_mask, used_pieces, target_mask, piece_idx=0):
         """Recursive solver with memoization"""
         # Create cache key
-        cache_key = (covered_mask, used_pieces)
+        cache_key = pack_state(covered_mask, used_pieces)
         
-        if cache_key in self.memo:
+        stats = self.stats
+        if stats is not None:
+            depth = bin(used_pieces).count("1")
+            stats.enter(depth)
+        
+        cached = self.memo.get(cache_key)
+        if cached is not None:
             self.cache_hits += 1
-            return self.memo[cache_key]
+            if stats is not None:
+                stats.memo_hits += 1
+            return cached
         
         self.cache_misses += 1
+        if stats is not None:
+            stats.memo_misses += 1
         
         # Check if we've used all pieces
         if used_pieces == (1 << len(self.pieces)) - 1:
@@ -199,12 +250,12 @@ class OptimizedDPSolver:
             else:
                 result = []
             
-            self.memo[cache_key] = result
+            self.memo.put(cache_key, result)
             return result
         
         # Early termination: if we have covered positions that should be targets
         if covered_mask & target_mask:
-            self.memo[cache_key] = []
+            self.memo.put(cache_key, [])
             return []
         
         solutions = []
@@ -220,12 +271,19 @@ class OptimizedDPSolver:
                 
                 # Check if placement conflicts with already covered positions
                 if covered_mask & piece_mask:
+                    if stats is not None:
+                        stats.tally(depth, 1, 1)
                     continue  # Overlap with existing pieces
                 
                 # Check if placement covers target positions
                 if piece_mask & target_mask:
+                    if stats is not None:
+                        stats.placements_tried += 1
                     continue  # Would cover target positions
                 
+                if stats is not None:
+                    stats.tally(depth, 1, 0)
+                
                 # Place piece and recurse
                 new_covered = covered_mask | piece_mask
                 new_used = used_pieces | (1 << piece_idx)
@@ -238,7 +296,7 @@ class OptimizedDPSolver:
                     enhanced_sol[f'piece_{piece_idx}'] = placement
                     solutions.append(enhanced_sol)
         
-        self.memo[cache_key] = solutions
+        self.memo.put(cache_key, solutions)
         return solutions
     
     def solve_for_date(self, day, month, weekday):
@@ -266,6 +324,8 @@ class OptimizedDPSolver:
         self.memo.clear()
         self.cache_hits = 0
         self.cache_misses = 0
+        if self.stats is not None:
+            self.stats.reset()
         
         # Create target mask
         target_mask = self.create_target_mask(day, month_abbr, day_abbr)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+parallel_solver.py – fan date solving out over a process pool
+
+Every worker process builds one solver instance in its initializer (so the
+placement tables are computed once per worker, not once per date) and then
+answers ``solve_for_date`` calls.  ``Executor.map`` hands results back in
+submission order, so callers get them in date order no matter which worker
+finished first.
+
+``search_subtrees_in_pool`` does the same for the subtrees of one date's
+search, so a single hard date (or a full enumeration) uses every core.
+
+On a free-threaded build with the GIL disabled the same work can run on a
+thread pool instead (``solve_dates_in_threads``, ``search_subtrees_in_threads``):
+threads share the compiled tables and one lock-striped transposition table
+without pickling anything.  ``resolve_backend("auto")`` picks threads only
+when ``sys._is_gil_enabled()`` reports the GIL off, processes otherwise.
+
+``measure_worker_startup`` reports how long each worker's initializer took
+and how much resident memory it added, for comparing ways of getting the
+placement tables into workers (rebuild, table cache, shared memory).
+"""
+
+from __future__ import annotations
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Date = Tuple[int, int, int]          # (day, month, weekday)
+
+BACKENDS = ("auto", "process", "thread")
+
+# per-process solver, created by _init_worker
+_worker_solver: Any = None
+# what building it cost: pid, init_ns, rss_kb, rss_growth_kb
+_worker_startup: Dict[str, int] = {}
+# shared by measure_worker_startup's workers so each reports exactly once
+_startup_barrier: Any = None
+
+
+def _rss_kb() -> int:
+    """Resident set size of this process in KiB (0 where /proc is missing)."""
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _init_worker(solver_cls: type, solver_kwargs: Dict[str, Any]) -> None:
+    global _worker_solver, _worker_startup
+    rss_before = _rss_kb()
+    start = time.perf_counter_ns()
+    _worker_solver = solver_cls(**solver_kwargs)
+    elapsed = time.perf_counter_ns() - start
+    rss = _rss_kb()
+    _worker_startup = {"pid": os.getpid(), "init_ns": elapsed,
+                       "rss_kb": rss, "rss_growth_kb": rss - rss_before}
+
+
+def _solve_date(date: Date) -> List[List[List[int]]]:
+    day, month, weekday = date
+    solutions = _worker_solver.solve_for_date(day, month, weekday)
+    # workers are never told they are about to exit: flush persistent caches now
+    persist = getattr(_worker_solver, "persist_dead_states", None)
+    if persist is not None:
+        persist()
+    return solutions
+
+
+def solve_dates_in_pool(solver_cls: type,
+                        dates: Sequence[Date],
+                        jobs: int,
+                        solver_kwargs: Optional[Dict[str, Any]] = None,
+                        chunksize: Optional[int] = None) -> List[List[List[List[int]]]]:
+    """Solve every date on `jobs` worker processes; results follow `dates` order.
+
+    Consecutive dates are sent to a worker in chunks so its solver keeps
+    reusing the transposition table it built for the previous dates.
+    """
+    if chunksize is None:
+        chunksize = max(1, len(dates) // (jobs * 4))
+
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(solver_cls, solver_kwargs or {})) as pool:
+        return list(pool.map(_solve_date, dates, chunksize=chunksize))
+
+
+def solutions_by_date(dates: Sequence[Date], results: Sequence[List[List[List[int]]]],
+                      months: Dict[str, int], days: Dict[str, int]) -> Dict[str, List]:
+    """Pool results as solve_all_dates returns them.
+
+    Keys are "day MONTH WEEKDAY" (abbreviations looked up in `months` and
+    `days`); dates without a solution are left out.
+    """
+    out: Dict[str, List] = {}
+    for (day, month, weekday), solutions in zip(dates, results):
+        if solutions:
+            month_abbr = next(k for k, v in months.items() if v == month)
+            day_abbr = next(k for k, v in days.items() if v == weekday)
+            out[f"{day} {month_abbr} {day_abbr}"] = [
+                {"solution_id": idx, "board_state": board}
+                for idx, board in enumerate(solutions)
+            ]
+    return out
+
+
+def _search_subtree(task: Tuple[int, int, bool]) -> Any:
+    board_mask, used_mask, count_only = task
+    result = _worker_solver.search_subtree(board_mask, used_mask, count_only)
+    persist = getattr(_worker_solver, "persist_dead_states", None)
+    if persist is not None:
+        persist()
+    return result
+
+
+def search_subtrees_in_pool(solver_cls: type,
+                            subtrees: Sequence[Tuple[int, int]],
+                            jobs: int,
+                            solver_kwargs: Optional[Dict[str, Any]] = None,
+                            count_only: bool = False) -> List[Any]:
+    """Search every (board_mask, used_mask) state on `jobs` worker processes.
+
+    States are handed out one at a time from the pool's shared queue, so a
+    worker that finishes a small subtree takes the next one straight away
+    while another is still deep in a large one.  Results (tiling lists, or
+    counts with `count_only`) follow `subtrees` order.
+    """
+    tasks = [(board_mask, used_mask, count_only) for board_mask, used_mask in subtrees]
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(solver_cls, solver_kwargs or {})) as pool:
+        return list(pool.map(_search_subtree, tasks, chunksize=1))
+
+
+# ───────────────────────────  thread backend  ─────────────────────────
+def gil_enabled() -> bool:
+    """False only on a free-threaded build running with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def resolve_backend(backend: str) -> str:
+    """"process" or "thread"; "auto" means threads only without a GIL."""
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}; choose from {BACKENDS}")
+    if backend == "auto":
+        return "process" if gil_enabled() else "thread"
+    return backend
+
+
+def _map_in_threads(make_view: Callable[[], Any], fn: Callable[[Any, Any], Any],
+                    items: Sequence[Any], jobs: int) -> List[Any]:
+    # one solver view per thread, built the first time the thread runs a task
+    local = threading.local()
+
+    def call(item: Any) -> Any:
+        view = getattr(local, "solver", None)
+        if view is None:
+            view = local.solver = make_view()
+        return fn(view, item)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(call, items))
+
+
+def solve_dates_in_threads(make_view: Callable[[], Any], dates: Sequence[Date],
+                           jobs: int) -> List[List[List[List[int]]]]:
+    """`solve_dates_in_pool` on threads; `make_view` returns a solver for one
+    thread (sharing tables and a thread-safe memo with the others)."""
+    return _map_in_threads(make_view, lambda solver, date: solver.solve_for_date(*date),
+                           dates, jobs)
+
+
+def search_subtrees_in_threads(make_view: Callable[[], Any],
+                               subtrees: Sequence[Tuple[int, int]],
+                               jobs: int, count_only: bool = False) -> List[Any]:
+    """`search_subtrees_in_pool` on threads; results follow `subtrees` order."""
+    return _map_in_threads(make_view,
+                           lambda solver, state: solver.search_subtree(*state, count_only),
+                           subtrees, jobs)
+
+
+# ───────────────────────────  start-up probe  ─────────────────────────
+def _init_measured_worker(solver_cls: type, solver_kwargs: Dict[str, Any],
+                          barrier: Any) -> None:
+    global _startup_barrier
+    _startup_barrier = barrier
+    _init_worker(solver_cls, solver_kwargs)
+
+
+def _startup_report(_: int) -> Dict[str, int]:
+    # every worker blocks here until all have one task, so none reports twice
+    _startup_barrier.wait()
+    return _worker_startup
+
+
+def measure_worker_startup(solver_cls: type, jobs: int,
+                           solver_kwargs: Optional[Dict[str, Any]] = None
+                           ) -> List[Dict[str, int]]:
+    """Start `jobs` workers and return each one's start-up cost.
+
+    ``init_ns`` times the solver constructor in the worker; ``rss_growth_kb``
+    is the resident memory it added on top of what the worker started with.
+    """
+    barrier = multiprocessing.Barrier(jobs)
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_measured_worker,
+                             initargs=(solver_cls, solver_kwargs or {}, barrier)) as pool:
+        return sorted(pool.map(_startup_report, range(jobs)), key=lambda r: r["pid"])
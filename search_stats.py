@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+search_stats.py – uniform search-effort counters shared by every solver
+
+Each solver takes ``collect_stats=True`` and then exposes a ``SearchStats``
+instance as ``solver.stats`` (``None`` when disabled, so the hot loops only
+pay for an ``is not None`` test per node).  Counters are reset at the start
+of every ``solve_for_date`` / ``count_solutions`` / ``iter_solutions`` call.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List
+
+
+class SearchStats:
+    """Where a search spent its effort.
+
+    nodes               search states visited (memo hits included)
+    placements_tried    candidate placements tested against the board
+    overlap_rejections  candidates rejected because a cell was already covered
+    memo_hits/misses    transposition-table lookups
+    region_prunes       states cut by connected-region size analysis
+    forward_check_prunes  states cut because an empty cell or unused piece
+                        had no valid placement left
+    forced_moves        placements committed by propagation, not branched on
+    max_depth           deepest level reached (= pieces placed)
+    depth_nodes[d]      nodes visited at depth d
+    depth_children[d]   children recursed into from depth d
+    """
+
+    __slots__ = ("nodes", "placements_tried", "overlap_rejections",
+                 "memo_hits", "memo_misses", "region_prunes", "forward_check_prunes",
+                 "forced_moves", "max_depth", "depth_nodes", "depth_children")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.nodes = 0
+        self.placements_tried = 0
+        self.overlap_rejections = 0
+        self.memo_hits = 0
+        self.memo_misses = 0
+        self.region_prunes = 0
+        self.forward_check_prunes = 0
+        self.forced_moves = 0
+        self.max_depth = 0
+        self.depth_nodes: List[int] = []
+        self.depth_children: List[int] = []
+
+    # ────────────────────────────  recording  ─────────────────────────────
+    def enter(self, depth: int) -> None:
+        """Count one visited node at `depth`."""
+        self.nodes += 1
+        while len(self.depth_nodes) <= depth:
+            self.depth_nodes.append(0)
+            self.depth_children.append(0)
+        self.depth_nodes[depth] += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def tally(self, depth: int, tried: int, overlaps: int) -> None:
+        """Record a node's candidate scan; every non-overlapping try is a child."""
+        self.placements_tried += tried
+        self.overlap_rejections += overlaps
+        self.depth_children[depth] += tried - overlaps
+
+    # ────────────────────────────  reporting  ─────────────────────────────
+    def branching_factors(self) -> List[float]:
+        """Average children per visited node, per depth."""
+        return [children / nodes if nodes else 0.0
+                for nodes, children in zip(self.depth_nodes, self.depth_children)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "placements_tried": self.placements_tried,
+            "overlap_rejections": self.overlap_rejections,
+            "memo_hits": self.memo_hits,
+            "memo_misses": self.memo_misses,
+            "region_prunes": self.region_prunes,
+            "forward_check_prunes": self.forward_check_prunes,
+            "forced_moves": self.forced_moves,
+            "max_depth": self.max_depth,
+            "depth_nodes": list(self.depth_nodes),
+            "branching_factors": self.branching_factors(),
+        }
+
+    def __str__(self) -> str:
+        factors = " ".join(f"{f:.2f}" for f in self.branching_factors())
+        return (f"{self.nodes} nodes, {self.placements_tried} placements tried "
+                f"({self.overlap_rejections} overlaps), memo {self.memo_hits} hits / "
+                f"{self.memo_misses} misses, {self.region_prunes} region prunes, "
+                f"{self.forward_check_prunes} forward-check prunes, "
+                f"{self.forced_moves} forced moves, "
+                f"max depth {self.max_depth}, branching [{factors}]")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+shared_tables.py – compiled placement tables published once for pool workers
+
+``SharedPlacementTables.publish(solver)`` flattens a FastCalendarPuzzleSolver's
+compiled tables into one ``multiprocessing.shared_memory`` block of int64s:
+
+    cells          bit → row * width + col
+    masks          every placement mask, grouped by piece
+    bits           1 << piece of each placement (its used-piece bit)
+    piece_offsets  masks[piece_offsets[p]:piece_offsets[p + 1]] are piece p's
+    live           1 where the placement survived static pruning
+    options        placement indices covering each cell, in search order
+    cell_offsets   options[cell_offsets[b]:cell_offsets[b + 1]] cover bit b
+
+Workers receive the small, picklable ``handle`` instead of rebuilding the
+tables (or reading the table cache) and attach to the block.  A solver built
+with ``shared_tables=handle`` reads its tables with ``tables()``, which turns
+the views back into the solver's usual table layout (each (piece, mask)
+option tuple is created once and shared by every cell it covers), and
+unmaps the block again; its searches are the ordinary ones.
+
+The publishing process owns the block: use it as a context manager, or call
+``unlink()``, once every worker is done.
+"""
+
+from __future__ import annotations
+import weakref
+from array import array
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+ITEMSIZE = 8                    # int64 slots; 52-bit masks fit comfortably
+SECTIONS = ("cells", "masks", "bits", "piece_offsets", "live", "options", "cell_offsets")
+
+
+class SharedPlacementTables:
+    """One shared-memory block holding a solver's compiled tables."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: Dict[str, Any],
+                 owner: bool) -> None:
+        self.shm = shm
+        self.handle = handle
+        self.owner = owner
+        self._views: Optional[memoryview] = shm.buf.cast("q")
+        # releases the views before SharedMemory's own finaliser closes the
+        # map, also when both are collected as part of one reference cycle
+        self._release = weakref.finalize(self, self._views.release)
+
+    # ─────────────────────────────  publishing  ───────────────────────────
+    @classmethod
+    def publish(cls, solver: Any) -> "SharedPlacementTables":
+        """Copy `solver`'s compiled tables into a new shared-memory block."""
+        width = len(solver.BOARD[0])
+        cells = [r * width + c for r, c in (solver.bit_to_pos[bit]
+                                            for bit in range(len(solver.bit_to_pos)))]
+        masks: List[int] = []
+        bits: List[int] = []
+        piece_offsets = [0]
+        index: Dict[Tuple[int, int], int] = {}
+        for p_idx, placements in enumerate(solver.placements_by_piece):
+            for mask in placements:
+                index[(p_idx, mask)] = len(masks)
+                masks.append(mask)
+                bits.append(1 << p_idx)
+            piece_offsets.append(len(masks))
+        live_sets = [set(placements) for placements in solver.live_placements_by_piece]
+        live = [int(mask in live_sets[p_idx])
+                for p_idx in range(len(solver.placements_by_piece))
+                for mask in solver.placements_by_piece[p_idx]]
+        options: List[int] = []
+        cell_offsets = [0]
+        for cell_options in solver.cell_to_options:
+            options.extend(index[option] for option in cell_options)
+            cell_offsets.append(len(options))
+
+        arrays = {"cells": cells, "masks": masks, "bits": bits, "piece_offsets": piece_offsets,
+                  "live": live, "options": options, "cell_offsets": cell_offsets}
+        layout: Dict[str, Tuple[int, int]] = {}
+        start = 0
+        for name in SECTIONS:
+            layout[name] = (start, len(arrays[name]))
+            start += len(arrays[name])
+
+        shm = shared_memory.SharedMemory(create=True, size=max(1, start) * ITEMSIZE)
+        view = shm.buf.cast("q")
+        for name in SECTIONS:
+            offset, length = layout[name]
+            view[offset:offset + length] = array("q", arrays[name])
+        view.release()
+
+        handle = {"name": shm.name, "layout": layout, "width": width,
+                  "definition_hash": solver.definition_hash(),
+                  "pruned_placements": solver.pruned_placements}
+        return cls(shm, handle, owner=True)
+
+    @classmethod
+    def attach(cls, handle: Dict[str, Any]) -> "SharedPlacementTables":
+        """Map the block described by `handle` (from a publisher's .handle)."""
+        return cls(shared_memory.SharedMemory(name=handle["name"]), handle, owner=False)
+
+    # ──────────────────────────────  reading  ─────────────────────────────
+    def view(self, name: str) -> memoryview:
+        """Zero-copy int64 view of one section."""
+        offset, length = self.handle["layout"][name]
+        return self._views[offset:offset + length]
+
+    def positions(self) -> Tuple[Dict[Tuple[int, int], int], Dict[int, Tuple[int, int]]]:
+        """pos_to_bit and bit_to_pos, from the cells section."""
+        width = self.handle["width"]
+        bit_to_pos = {bit: divmod(cell, width) for bit, cell in enumerate(self.view("cells"))}
+        return {pos: bit for bit, pos in bit_to_pos.items()}, bit_to_pos
+
+    def tables(self) -> Dict[str, Any]:
+        """The solver's COMPILED_TABLES built from the shared arrays."""
+        pos_to_bit, bit_to_pos = self.positions()
+        masks = self.view("masks")
+        live = self.view("live")
+        offsets = self.view("piece_offsets").tolist()
+
+        placements_by_piece = []
+        live_placements_by_piece = []
+        option_by_index: List[Tuple[int, int]] = []
+        for p_idx in range(len(offsets) - 1):
+            lo, hi = offsets[p_idx], offsets[p_idx + 1]
+            piece_masks = tuple(masks[lo:hi])
+            placements_by_piece.append(piece_masks)
+            live_placements_by_piece.append(
+                tuple(mask for mask, alive in zip(piece_masks, live[lo:hi]) if alive))
+            option_by_index.extend((p_idx, mask) for mask in piece_masks)
+
+        options = self.view("options")
+        cell_offsets = self.view("cell_offsets").tolist()
+        cell_to_options = [[option_by_index[i] for i in options[lo:hi]]
+                           for lo, hi in zip(cell_offsets, cell_offsets[1:])]
+
+        return {"pos_to_bit": pos_to_bit,
+                "bit_to_pos": bit_to_pos,
+                "placements_by_piece": placements_by_piece,
+                "cell_to_options": cell_to_options,
+                "live_placements_by_piece": live_placements_by_piece,
+                "pruned_placements": self.handle["pruned_placements"]}
+
+    # ─────────────────────────────  lifetime  ─────────────────────────────
+    def close(self) -> None:
+        """Unmap the block in this process."""
+        if self._views is not None:
+            self._release()
+            self._views = None
+            self.shm.close()
+
+    def unlink(self) -> None:
+        """Close and, in the publishing process, free the block."""
+        self.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self) -> "SharedPlacementTables":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.unlink()
+
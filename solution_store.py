@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+solution_store.py – compact binary solution database
+
+A solution is fully described by one placement index per piece, so instead
+of pretty-printed 8×7 boards the store keeps fixed-size records of
+``len(PIECES)`` little-endian uint16 indices into ``placements_by_piece``.
+
+File layout (all little-endian):
+
+    header      magic "WCPS", version u16, piece count u16,
+                sha256 of the puzzle definition (32 bytes),
+                placement count u32, date count u32, record count u32
+    placements  per piece: count u32, then that many u64 placement masks
+    date index  per date: day u8, month u8, weekday u8, pad u8,
+                first record u32, record count u32
+    records     record count × piece count × u16 placement index
+
+The placement table is embedded so readers can turn records back into
+boards without regenerating orientations; the hash guards against decoding
+with a different BOARD/PIECES definition – a store whose hash does not
+match FastCalendarPuzzleSolver's is rejected when it is opened.
+
+Usage (CLI):
+    ./solution_store.py to-bin  dp_calendar_solutions.json dp_calendar_solutions.bin
+    ./solution_store.py to-json dp_calendar_solutions.bin  dp_calendar_solutions.json
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fast_dp_solver import FastCalendarPuzzleSolver
+
+MAGIC = b"WCPS"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH32sIII")
+_INDEX_ENTRY = struct.Struct("<BBBxII")
+
+Date = Tuple[int, int, int]          # (day, month, weekday)
+Record = Tuple[int, ...]             # one placement index per piece
+
+
+# ────────────────────────────  DATE KEYS  ─────────────────────────────
+def date_key(day: int, month: int, weekday: int) -> str:
+    """JSON key used by the solvers, e.g. ``"1 OCA PZT"``."""
+    cls = FastCalendarPuzzleSolver
+    month_abbr = next(k for k, v in cls.MONTHS.items() if v == month)
+    day_abbr = next(k for k, v in cls.DAYS.items() if v == weekday)
+    return f"{day} {month_abbr} {day_abbr}"
+
+
+def parse_date_key(key: str) -> Date:
+    day, month_abbr, day_abbr = key.split()
+    cls = FastCalendarPuzzleSolver
+    return int(day), cls.MONTHS[month_abbr], cls.DAYS[day_abbr]
+
+
+# ───────────────────────────  BOARD CODEC  ────────────────────────────
+def _bit_positions(board: Sequence[Sequence[str]]) -> List[Tuple[int, int]]:
+    """bit → (row, col), numbered exactly like the solvers number them."""
+    return [(r, c) for r, row in enumerate(board) for c, cell in enumerate(row) if cell]
+
+
+def board_to_record(solver: FastCalendarPuzzleSolver, board: List[List[int]]) -> Record:
+    """Encode a solved board (piece ids 1…N) as placement indices."""
+    masks = [0] * len(solver.PIECES)
+    for (r, c), bit in solver.pos_to_bit.items():
+        code = board[r][c]
+        if code > 0:
+            masks[code - 1] |= 1 << bit
+
+    lookup = _placement_lookup(solver)
+    return tuple(lookup[p_idx][mask] for p_idx, mask in enumerate(masks))
+
+
+def moves_to_record(solver: FastCalendarPuzzleSolver, moves: Sequence[Tuple[int, int]]) -> Record:
+    """Encode a tiling given as (piece_idx, placement_mask) moves."""
+    lookup = _placement_lookup(solver)
+    record = [0] * len(solver.PIECES)
+    for p_idx, mask in moves:
+        record[p_idx] = lookup[p_idx][mask]
+    return tuple(record)
+
+
+def _placement_lookup(solver: FastCalendarPuzzleSolver) -> List[Dict[int, int]]:
+    cached = getattr(solver, "_placement_index", None)
+    if cached is None:
+        cached = [{mask: i for i, mask in enumerate(placements)}
+                  for placements in solver.placements_by_piece]
+        solver._placement_index = cached
+    return cached
+
+
+# ───────────────────────────  STORE (READ)  ───────────────────────────
+class SolutionStore:
+    """Read-only view of a binary solution file with O(1) date lookup."""
+
+    def __init__(self, data: bytes) -> None:
+        (magic, version, n_pieces, digest,
+         n_placements, n_dates, n_records) = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("not a calendar solution store (bad magic)")
+        if version != VERSION:
+            raise ValueError(f"unsupported solution store version {version}")
+
+        self.n_pieces = n_pieces
+        self.definition_hash = digest.hex()
+        # boards are decoded on FastCalendarPuzzleSolver.BOARD, so it must match
+        self.check_definition()
+
+        offset = _HEADER.size
+        self.placements_by_piece: List[Tuple[int, ...]] = []
+        for _ in range(n_pieces):
+            (count,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            self.placements_by_piece.append(struct.unpack_from(f"<{count}Q", data, offset))
+            offset += 8 * count
+        if sum(map(len, self.placements_by_piece)) != n_placements:
+            raise ValueError("corrupt solution store (placement table size)")
+
+        self._index: Dict[Date, Tuple[int, int]] = {}
+        for _ in range(n_dates):
+            day, month, weekday, first, count = _INDEX_ENTRY.unpack_from(data, offset)
+            self._index[(day, month, weekday)] = (first, count)
+            offset += _INDEX_ENTRY.size
+
+        if len(data) - offset != 2 * n_records * n_pieces:
+            raise ValueError("corrupt solution store (record section size)")
+        self._data = data
+        self._records_offset = offset
+
+        self._bit_pos = _bit_positions(FastCalendarPuzzleSolver.BOARD)
+
+    @classmethod
+    def load(cls, path: str) -> "SolutionStore":
+        with open(path, "rb") as fh:
+            return cls(fh.read())
+
+    def check_definition(self, solver: Optional[FastCalendarPuzzleSolver] = None) -> None:
+        """Raise ValueError if the store was written for another puzzle."""
+        if self.definition_hash != (solver or FastCalendarPuzzleSolver).definition_hash():
+            raise ValueError("solution store was built for a different BOARD/PIECES definition")
+
+    # ─────────────────────────  lookups  ──────────────────────────
+    def dates(self) -> List[Date]:
+        return list(self._index)
+
+    def __contains__(self, date: Date) -> bool:
+        return date in self._index
+
+    def count(self, day: int, month: int, weekday: int) -> int:
+        return self._index.get((day, month, weekday), (0, 0))[1]
+
+    def records(self, day: int, month: int, weekday: int) -> List[Record]:
+        first, count = self._index.get((day, month, weekday), (0, 0))
+        n = self.n_pieces
+        flat = struct.unpack_from(f"<{count * n}H", self._data,
+                                  self._records_offset + 2 * first * n)
+        return [flat[i:i + n] for i in range(0, count * n, n)]
+
+    def record_to_board(self, record: Record) -> List[List[int]]:
+        """Decode a record; cells no piece covers are the date (-1)."""
+        board_rows = FastCalendarPuzzleSolver.BOARD
+        board = [[-1 if cell else -2 for cell in row] for row in board_rows]
+        for p_idx, pl_idx in enumerate(record):
+            mask = self.placements_by_piece[p_idx][pl_idx]
+            while mask:
+                low = mask & -mask
+                r, c = self._bit_pos[low.bit_length() - 1]
+                board[r][c] = p_idx + 1
+                mask ^= low
+        return board
+
+    def boards(self, day: int, month: int, weekday: int) -> List[List[List[int]]]:
+        return [self.record_to_board(rec) for rec in self.records(day, month, weekday)]
+
+
+# ───────────────────────────  STORE (WRITE)  ──────────────────────────
+def write_store(path: str,
+                solver: FastCalendarPuzzleSolver,
+                solutions: Dict[Date, Sequence[Record]]) -> None:
+    """Write `solutions` (date → records) in date-insertion order."""
+    n_pieces = len(solver.PIECES)
+    placements = solver.placements_by_piece
+
+    chunks: List[bytes] = []
+    n_records = sum(len(recs) for recs in solutions.values())
+    chunks.append(_HEADER.pack(MAGIC, VERSION, n_pieces,
+                               bytes.fromhex(solver.definition_hash()),
+                               sum(map(len, placements)), len(solutions), n_records))
+    for masks in placements:
+        chunks.append(struct.pack(f"<I{len(masks)}Q", len(masks), *masks))
+
+    first = 0
+    for (day, month, weekday), recs in solutions.items():
+        chunks.append(_INDEX_ENTRY.pack(day, month, weekday, first, len(recs)))
+        first += len(recs)
+
+    record_fmt = struct.Struct(f"<{n_pieces}H")
+    for recs in solutions.values():
+        chunks.extend(record_fmt.pack(*rec) for rec in recs)
+
+    with open(path, "wb") as fh:
+        fh.write(b"".join(chunks))
+
+
+# ────────────────────────────  CONVERTERS  ────────────────────────────
+def json_to_store(json_path: str, store_path: str,
+                  solver: Optional[FastCalendarPuzzleSolver] = None) -> int:
+    """Convert a solver JSON dump to a binary store; returns records written."""
+    solver = solver or FastCalendarPuzzleSolver()
+    with open(json_path, encoding="utf-8") as fh:
+        raw = json.load(fh)
+
+    solutions: Dict[Date, List[Record]] = {}
+    for key, entries in raw.items():
+        solutions[parse_date_key(key)] = [board_to_record(solver, e["board_state"])
+                                          for e in entries]
+    write_store(store_path, solver, solutions)
+    return sum(len(recs) for recs in solutions.values())
+
+
+def store_to_json(store_path: str, json_path: str) -> int:
+    """Expand a binary store back into the solvers' JSON format."""
+    store = SolutionStore.load(store_path)
+    out: Dict[str, List] = {}
+    for day, month, weekday in store.dates():
+        out[date_key(day, month, weekday)] = [
+            {"solution_id": idx, "board_state": board}
+            for idx, board in enumerate(store.boards(day, month, weekday))
+        ]
+    with open(json_path, "w", encoding="utf-8") as fh:
+        json.dump(out, fh, ensure_ascii=False, indent=2)
+    return sum(len(v) for v in out.values())
+
+
+# ───────────────────────────  CLI entry  ─────────────────────────────
+def _main() -> None:
+    parser = argparse.ArgumentParser(description="Convert between JSON and binary solution stores")
+    sub = parser.add_subparsers(dest="command", required=True)
+    to_bin = sub.add_parser("to-bin", help="JSON → binary store")
+    to_bin.add_argument("src")
+    to_bin.add_argument("dst")
+    to_json = sub.add_parser("to-json", help="binary store → JSON")
+    to_json.add_argument("src")
+    to_json.add_argument("dst")
+    args = parser.parse_args()
+
+    if args.command == "to-bin":
+        n = json_to_store(args.src, args.dst)
+    else:
+        n = store_to_json(args.src, args.dst)
+    print(f"Wrote {n} solution(s) to {args.dst}")
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+table_cache.py – compiled placement tables cached on disk
+
+Every solver constructor turns BOARD and PIECES into lookup tables (cell →
+bit maps, every legal placement of every piece, the placements covering
+each cell) in pure Python, and the fast solver then runs its static
+placement pruning on top.  That happens again on every CLI call and in every
+pool worker although the result only depends on the puzzle definition.
+
+``load_tables`` / ``save_tables`` keep those tables as one ``marshal`` blob
+per solver kind, named after the definition hash, so a warm constructor does
+a single file read.  marshal keeps repeated objects shared, so the
+(piece, mask) tuples listed under several cells are stored – and loaded –
+once.  Each blob also records a fingerprint of the code that built it
+(``code_fingerprint`` over the solver's table-building functions), so
+changing how placements are generated, ordered or pruned invalidates the
+blobs of older code.  A blob whose format version, hash or fingerprint does
+not match is ignored and rebuilt; any I/O problem just means the tables are
+computed as before.
+
+The cache directory is ``$CALENDAR_TABLE_CACHE`` if set, otherwise
+``$XDG_CACHE_HOME/wooden-calendar-puzzle`` (``~/.cache/...``).  Solvers take
+``table_cache=False`` to bypass it.
+"""
+
+from __future__ import annotations
+import hashlib
+import marshal
+import os
+import types
+from typing import Any, Callable, Dict, Optional
+
+# bump when the layout of any cached table changes
+FORMAT_VERSION = 2
+
+
+def cache_dir() -> str:
+    """Directory holding the compiled-table blobs."""
+    path = os.environ.get("CALENDAR_TABLE_CACHE")
+    if path:
+        return path
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "wooden-calendar-puzzle")
+
+
+def code_fingerprint(*functions: Callable[..., Any]) -> str:
+    """Hash of the bytecode, names and constants of `functions`.
+
+    Line numbers and file paths are left out, so only edits to the
+    functions themselves (or a different Python bytecode) change it.
+    """
+    digest = hashlib.sha256()
+    for fn in functions:
+        _hash_code(digest, fn.__code__)
+    return digest.hexdigest()[:16]
+
+
+def _hash_code(digest: Any, code: types.CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):          # nested function / comprehension
+            _hash_code(digest, const)
+        elif isinstance(const, frozenset):             # set order varies between runs
+            digest.update(repr(sorted(map(repr, const))).encode())
+        else:
+            digest.update(repr(const).encode())
+
+
+def _blob_path(kind: str, definition_hash: str) -> str:
+    return os.path.join(cache_dir(), f"{kind}-{definition_hash[:16]}.marshal")
+
+
+def load_tables(kind: str, definition_hash: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+    """Tables saved for this solver kind, puzzle definition and code, else None."""
+    try:
+        with open(_blob_path(kind, definition_hash), "rb") as fh:
+            # one read + loads: marshal.load on a file object reads piecemeal
+            version, stored_hash, stored_fingerprint, tables = marshal.loads(fh.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if (version != FORMAT_VERSION or stored_hash != definition_hash
+            or stored_fingerprint != fingerprint):
+        return None
+    return tables
+
+
+def save_tables(kind: str, definition_hash: str, fingerprint: str,
+                tables: Dict[str, Any]) -> None:
+    """Write `tables` for later constructors; failures are ignored."""
+    path = _blob_path(kind, definition_hash)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "wb") as fh:
+            fh.write(marshal.dumps((FORMAT_VERSION, definition_hash, fingerprint, tables)))
+        # atomic swap: concurrent pool workers never see a half-written blob
+        os.replace(tmp, path)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
@@ -1,8 +1,77 @@
 #!/usr/bin/env python3
 
+import asyncio
+from async_solver import AsyncCalendarSolver
+import benchmark_solvers
+import distributed_solver
 from calendar_puzzle_solver import CalendarPuzzleSolver
+from dead_state_cache import DeadStateCache
+from dp_calendar_solver import DPCalendarPuzzleSolver
+from fast_dp_solver import FastCalendarPuzzleSolver
+from shared_tables import SharedPlacementTables
+from solution_store import SolutionStore, board_to_record, json_to_store, store_to_json, write_store
+import table_cache
+import viewer
+from datetime import datetime
+from pathlib import Path
+import json
+import marshal
+import os
+import socket
+import tempfile
+import threading
 import time
 
+# Tiling counts of the three test dates (every solver configuration must agree)
+EXPECTED_COUNTS = {
+    (1, 1, 1): 796,    # 1 OCA PZT
+    (15, 3, 5): 349,   # 15 MAR CUM
+    (25, 12, 3): 253,  # 25 ARA CAR
+}
+
+# FastCalendarPuzzleSolver options that must not change the set of solutions
+FAST_VARIANTS = {
+    "no region pruning": {"region_pruning": False},
+    "no static pruning": {"static_pruning": False},
+    "mrv cell order": {"cell_order": "mrv"},
+    "forward checking": {"forward_checking": True},
+    "forced propagation": {"propagate_forced": True},
+    "dlx engine": {"engine": "dlx"},
+    "iterative engine": {"engine": "iterative"},
+    "no option table": {"option_table_size": 0},
+    "tiny LRU table": {"tt_capacity": 64, "tt_policy": "lru"},
+    "tiny clock table": {"tt_capacity": 64, "tt_policy": "clock"},
+}
+
+# What each FAST_VARIANTS option must visibly do, judged after enumerating
+# 15 MAR CUM against the default solver (both collect stats):
+# (variant, baseline) -> True when the effect shows
+VARIANT_EFFECTS = {
+    "no region pruning": lambda variant, baseline: (
+        variant.stats.region_prunes == 0 and variant.stats.nodes > baseline.stats.nodes),
+    "no static pruning": lambda variant, baseline: (
+        variant.pruned_placements == 0 < baseline.pruned_placements
+        and variant.stats.nodes > baseline.stats.nodes),
+    "mrv cell order": lambda variant, baseline: variant.stats.nodes < baseline.stats.nodes,
+    "forward checking": lambda variant, baseline: (
+        variant.stats.forward_check_prunes > 0 and variant.stats.nodes < baseline.stats.nodes),
+    "forced propagation": lambda variant, baseline: (
+        variant.stats.forced_moves > 0 and variant.stats.nodes < baseline.stats.nodes),
+    "dlx engine": lambda variant, baseline: (
+        variant.stats.max_depth == len(variant.PIECES) and variant.stats.placements_tried > 0),
+    # the same tree as the recursive DFS, walked with an explicit stack
+    "iterative engine": lambda variant, baseline: (
+        variant.stats.as_dict() == baseline.stats.as_dict()),
+    "no option table": lambda variant, baseline: (
+        variant._unused_options is None and baseline._unused_options.cache_info().hits > 0),
+    "tiny LRU table": lambda variant, baseline: (
+        variant.dead_states.evictions > 0 == baseline.dead_states.evictions
+        and len(variant.dead_states) <= 64),
+    "tiny clock table": lambda variant, baseline: (
+        variant.dead_states.evictions > 0 == baseline.dead_states.evictions
+        and len(variant.dead_states) <= 64),
+}
+
 def test_specific_dates():
     """Test the solver on a few specific dates"""
     solver = CalendarPuzzleSolver()
@@ -85,6 +154,304 @@ def display_solution(solver, solution, day, month_abbr, day_abbr):
     
     print(f"\nTarget date: {day} {month_abbr} {day_abbr}")
 
+def _solution_set(solver, day, month, weekday):
+    """Every solution board of a date as a set of hashable boards"""
+    return {tuple(map(tuple, board)) for board in solver.iter_solutions(day, month, weekday)}
+
+def test_fast_solver_variants():
+    """Every FAST_VARIANTS configuration must enumerate exactly the baseline
+    solutions"""
+    baseline = FastCalendarPuzzleSolver()
+    expected = {}
+    for date, count in EXPECTED_COUNTS.items():
+        expected[date] = _solution_set(baseline, *date)
+        assert len(expected[date]) == count, f"baseline {date}: {len(expected[date])} != {count}"
+    print(f"✅ baseline: {', '.join(str(len(s)) for s in expected.values())} solutions")
+
+    for name, options in FAST_VARIANTS.items():
+        solver = FastCalendarPuzzleSolver(**options)
+        for date, solutions in expected.items():
+            found = _solution_set(solver, *date)
+            assert found == solutions, f"{name} {date}: {len(found)} solutions differ from baseline"
+        print(f"✅ {name}: identical solutions")
+
+def test_variant_effects():
+    """Every VARIANT_EFFECTS option must change the search the way it
+    promises, not only leave the solutions alone"""
+    date = (15, 3, 5)
+    baseline = FastCalendarPuzzleSolver(collect_stats=True)
+    assert sum(1 for _ in baseline.iter_solutions(*date)) == EXPECTED_COUNTS[date]
+    for name, effect in VARIANT_EFFECTS.items():
+        variant = FastCalendarPuzzleSolver(collect_stats=True, **FAST_VARIANTS[name])
+        sum(1 for _ in variant.iter_solutions(*date))
+        assert effect(variant, baseline), f"{name}: no effect on the search ({variant.stats})"
+        print(f"✅ {name}: {variant.stats.nodes} nodes vs {baseline.stats.nodes} baseline")
+
+def test_dp_count_solutions():
+    """Count-only DP must give the tiling counts, also when the count memo
+    is carried over from an earlier date"""
+    solver = DPCalendarPuzzleSolver()
+    for date in ((15, 3, 5), (25, 12, 3)):
+        count = solver.count_solutions(*date, reset_memo=False)
+        assert count == EXPECTED_COUNTS[date], f"count_solutions {date}: {count} != {EXPECTED_COUNTS[date]}"
+    print("✅ DP count_solutions: 349 and 253 with a shared count memo")
+
+def test_solve_all_triples():
+    """The single bucketed pass must give each triple's tiling count and the
+    board solve_for_date returns, also with two dates sharing hole cells"""
+    solver = FastCalendarPuzzleSolver()
+    expected = {(7, 7, 5): 153, (7, 7, 6): 536, (28, 10, 1): 748}
+    for dates in (((7, 7, 5), (7, 7, 6)), ((28, 10, 1),)):
+        results = solver.solve_all_triples(dates=dates)
+        assert set(results) == set(dates), f"triples {dates}: returned {sorted(results)}"
+        for date in dates:
+            assert results[date]["count"] == expected[date], \
+                f"triples {date}: {results[date]['count']} != {expected[date]}"
+            assert results[date]["board_state"] == solver.solve_for_date(*date)[0], \
+                f"triples {date}: sample board differs from solve_for_date"
+    print("✅ solve_all_triples: 153, 536 and 748 tilings, solve_for_date boards")
+
+def test_shared_tables():
+    """A solver reading tables published in shared memory must hold the
+    publisher's tables and return the same solutions, with any engine"""
+    publisher = FastCalendarPuzzleSolver()
+    with SharedPlacementTables.publish(publisher) as shared:
+        solver = FastCalendarPuzzleSolver(shared_tables=shared.handle)
+        iterative = FastCalendarPuzzleSolver(engine="iterative", shared_tables=shared.handle)
+    for name in publisher.COMPILED_TABLES:
+        assert getattr(solver, name) == getattr(publisher, name), f"shared tables: {name} differs"
+    for date in EXPECTED_COUNTS:
+        assert solver.solve_for_date(*date) == publisher.solve_for_date(*date), \
+            f"shared tables {date}: first solution differs"
+    date = next(iter(EXPECTED_COUNTS))
+    assert _solution_set(iterative, *date) == _solution_set(publisher, *date), \
+        f"shared tables {date}: enumeration differs"
+    print("✅ shared tables: same tables and solutions as the publishing solver")
+
+def test_solve_date_split():
+    """A date split across workers must give the serial solutions, in order,
+    on both pool backends"""
+    solver = FastCalendarPuzzleSolver()
+    date = (15, 3, 5)
+    expected = list(solver.iter_solutions(*date))
+    for backend in ("process", "thread"):
+        boards = solver.solve_date_split(*date, jobs=2, mode="solutions", backend=backend)
+        assert boards == expected, f"split {backend}: solutions differ from iter_solutions"
+        count = solver.solve_date_split(*date, jobs=2, mode="count", backend=backend)
+        assert count == len(expected), f"split {backend}: count {count} != {len(expected)}"
+    print(f"✅ solve_date_split: {len(expected)} solutions on process and thread pools")
+
+def test_distributed_lease():
+    """A coordinator and worker on localhost must reassign a lease that was
+    never renewed and merge the units into the serial solutions"""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        address = probe.getsockname()
+    authkey = b"test"
+    date = (15, 3, 5)
+    served = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "distributed.bin")
+        server = threading.Thread(target=lambda: served.update(distributed_solver.run_coordinator(
+            address, authkey, path, [date], split_depth=1, lease_seconds=0.5,
+            poll_seconds=0.05, verbose=False)))
+        server.start()
+        manager = distributed_solver._ClientManager(address=address, authkey=authkey)
+        for _ in range(100):
+            try:
+                manager.connect()
+                break
+            except ConnectionRefusedError:
+                time.sleep(0.05)
+        coordinator = manager.coordinator()
+
+        # a worker that leases a unit and dies without renewing it
+        status, unit = coordinator.lease("dead worker")
+        assert status == "unit", f"distributed: first lease gave {status!r}"
+        completed = distributed_solver.run_worker(address, authkey)
+        done, leased, total = coordinator.progress()
+        assert completed == total and done == total and not leased, \
+            f"distributed: worker did {completed} of {total} units, {leased} still leased"
+        assert not coordinator.renew("dead worker", unit[0]), "distributed: expired lease renewed"
+        assert not coordinator.complete("dead worker", unit[0], []), \
+            "distributed: late result replaced the reassigned unit's"
+        assert coordinator.lease("dead worker")[0] == "done", "distributed: work left after the run"
+        server.join()
+
+        expected = list(FastCalendarPuzzleSolver().iter_solutions(*date))
+        assert SolutionStore.load(path).boards(*date) == expected, \
+            "distributed: merged store differs from iter_solutions"
+        assert len(served[date]) == len(expected), "distributed: returned records differ"
+    print(f"✅ distributed: {total} units, expired lease reassigned, {len(expected)} solutions")
+
+def test_async_solver():
+    """Identical concurrent requests must share one job, and cancelling a
+    request must free the single worker for the next one"""
+    async def run():
+        # without region pruning a full enumeration keeps the worker busy for seconds
+        async with AsyncCalendarSolver(jobs=1, solver_kwargs={"region_pruning": False}) as solver:
+            first, second = await asyncio.gather(solver.solve_for_date_async(15, 3, 5),
+                                                 solver.solve_for_date_async(15, 3, 5))
+            assert first == second == FastCalendarPuzzleSolver().solve_for_date(15, 3, 5), \
+                "async: shared request returned other boards"
+            jobs = next(solver._ids)
+            assert jobs == 1, f"async: two identical requests ran {jobs} jobs"
+
+            found = asyncio.Event()
+
+            async def enumerate_all():
+                async for _ in solver.iter_solutions_async(1, 1, 1):
+                    found.set()
+
+            task = asyncio.ensure_future(enumerate_all())
+            await found.wait()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            start = time.perf_counter()
+            boards = await solver.solve_for_date_async(25, 12, 3)
+            elapsed = time.perf_counter() - start
+            assert boards, "async: no solution after the cancelled request"
+            assert elapsed < 1.0, f"async: next request waited {elapsed:.2f}s for a cancelled search"
+            return elapsed
+
+    elapsed = asyncio.run(run())
+    print(f"✅ async solver: one job for two requests, {elapsed * 1000:.0f} ms after a cancel")
+
+def test_dead_state_cache():
+    """Runs reading dead states from an earlier run's sqlite file, also with a
+    bounded table, must return the same boards; another puzzle's file is emptied"""
+    definition = FastCalendarPuzzleSolver.definition_hash()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dead_states.sqlite")
+        first = FastCalendarPuzzleSolver(dead_cache=path)
+        expected = {date: first.solve_for_date(*date) for date in EXPECTED_COUNTS}
+        first.persist_dead_states()
+        first.dead_states.cache.close()
+        cache = DeadStateCache(path, definition)
+        stored = len(cache)
+        cache.close()
+        assert stored > 0, "no dead state was written to the cache file"
+
+        for name, options in (("second run", {}), ("bounded table", {"tt_capacity": 256})):
+            solver = FastCalendarPuzzleSolver(dead_cache=path, **options)
+            for date, boards in expected.items():
+                assert solver.solve_for_date(*date) == boards, f"dead cache {name} {date}: boards differ"
+            assert solver.dead_states.disk_hits > 0, f"dead cache {name}: nothing read from the file"
+            solver.persist_dead_states()
+            solver.dead_states.cache.close()
+
+        other = DeadStateCache(path, "0" * 64)
+        assert len(other) == 0, "dead cache kept states of another puzzle definition"
+        other.close()
+    print(f"✅ dead-state cache: {stored} states reused, other definitions rejected")
+
+def test_table_cache():
+    """A warm constructor must load the tables a cold one builds; blobs from
+    other table code or another format version must be ignored and rebuilt"""
+    cold = FastCalendarPuzzleSolver(table_cache=False)
+    expected = {name: getattr(cold, name) for name in cold.COMPILED_TABLES}
+    definition = cold.definition_hash()
+    fingerprint = cold.tables_fingerprint()
+    # wrong tables: used by mistake, they would change every comparison below
+    stale = dict(expected, cell_to_options=[[] for _ in expected["cell_to_options"]])
+    blobs = {"other fingerprint": (table_cache.FORMAT_VERSION, definition, "0" * 16, stale),
+             "other format version": (table_cache.FORMAT_VERSION + 1, definition, fingerprint, stale)}
+
+    previous = os.environ.get("CALENDAR_TABLE_CACHE")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["CALENDAR_TABLE_CACHE"] = tmp
+        try:
+            FastCalendarPuzzleSolver()                      # cold: writes the blob
+            warm = FastCalendarPuzzleSolver()
+            for name, table in expected.items():
+                assert getattr(warm, name) == table, f"table cache: warm {name} differs"
+
+            for label, blob in blobs.items():
+                with open(table_cache._blob_path("fast", definition), "wb") as fh:
+                    fh.write(marshal.dumps(blob))
+                solver = FastCalendarPuzzleSolver()
+                assert solver.cell_to_options == expected["cell_to_options"], \
+                    f"table cache: blob with {label} was used"
+                rebuilt = table_cache.load_tables("fast", definition, fingerprint)
+                assert rebuilt == expected, f"table cache: blob with {label} was not rebuilt"
+        finally:
+            if previous is None:
+                del os.environ["CALENDAR_TABLE_CACHE"]
+            else:
+                os.environ["CALENDAR_TABLE_CACHE"] = previous
+    print("✅ table cache: warm tables match, stale blobs rebuilt")
+
+def test_benchmark_registry():
+    """Every benchmark_solvers.SOLVERS entry must build and report; a solver
+    without solve_all_dates skips the full year instead of failing"""
+    for name in benchmark_solvers.SOLVERS:
+        entry = benchmark_solvers.benchmark_solver(name, 0, 1, False, 1, dates=())
+        assert entry["cold_start"]["samples_ns"], f"benchmark {name}: no cold-start sample"
+    entry = benchmark_solvers.benchmark_solver("fast", 0, 1, False, 1, dates=[(15, 3, 5)])
+    assert entry["warm_solve"][0]["solutions"] == 1, "benchmark fast: no solution for 15/3/5"
+    entry = benchmark_solvers.benchmark_solver("optimized-dp", 0, 1, True, 1, dates=())
+    assert "skipped" in entry["full_year"], "benchmark optimized-dp: full year not skipped"
+    print(f"✅ benchmark registry: {len(benchmark_solvers.SOLVERS)} solvers run")
+
+def test_solution_store_round_trip():
+    """JSON → binary store → JSON must reproduce every board"""
+    solver = FastCalendarPuzzleSolver()
+    original = {}
+    for day, month, weekday in EXPECTED_COUNTS:
+        month_abbr = next(k for k, v in solver.MONTHS.items() if v == month)
+        day_abbr = next(k for k, v in solver.DAYS.items() if v == weekday)
+        original[f"{day} {month_abbr} {day_abbr}"] = [
+            {"solution_id": idx, "board_state": board}
+            for idx, board in enumerate(solver.iter_solutions(day, month, weekday))
+        ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "solutions.json")
+        bin_path = os.path.join(tmp, "solutions.bin")
+        round_trip_path = os.path.join(tmp, "round_trip.json")
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump(original, fh)
+
+        written = json_to_store(json_path, bin_path, solver)
+        ratio = os.path.getsize(json_path) / os.path.getsize(bin_path)
+        assert ratio > 5, f"store: only {ratio:.1f}x smaller than compact JSON"
+        store = SolutionStore.load(bin_path)
+        for date, count in EXPECTED_COUNTS.items():
+            assert store.count(*date) == count, f"store {date}: {store.count(*date)} != {count}"
+        store_to_json(bin_path, round_trip_path)
+        with open(round_trip_path, encoding="utf-8") as fh:
+            restored = json.load(fh)
+
+    assert restored == original, "boards changed in the JSON ↔ binary round trip"
+    print(f"✅ solution store round trip: {written} solutions, {ratio:.0f}x smaller than JSON")
+
+def test_viewer_lookup():
+    """The viewer must read a date from the newest database (even when the
+    binary store is older than the JSON) and solve dates it does not hold"""
+    solver = FastCalendarPuzzleSolver()
+    marker = [[-1]]                      # not a board any solver returns
+    saved = viewer.SOLUTION_DB_PATHS, viewer._index, viewer._index_loaded
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_path, json_path = Path(tmp, "solutions.bin"), Path(tmp, "solutions.json")
+        write_store(str(bin_path), solver, {(15, 3, 5): [board_to_record(
+            solver, solver.solve_for_date(15, 3, 5)[0])]})
+        with open(json_path, "w", encoding="utf-8") as fh:
+            json.dump({"15 MAR CUM": [{"solution_id": 0, "board_state": marker}]}, fh)
+        os.utime(bin_path, (time.time() - 60, time.time() - 60))
+        viewer.SOLUTION_DB_PATHS = (bin_path, json_path)
+        viewer._index, viewer._index_loaded = None, False
+        try:
+            hit = viewer._solutions_for(datetime(2024, 3, 15))
+            assert hit == [marker], "viewer: date not read from the newer JSON database"
+            miss = viewer._solutions_for(datetime(2024, 12, 25))
+            assert miss == solver.solve_for_date(25, 12, 3), "viewer: miss not solved"
+        finally:
+            viewer.SOLUTION_DB_PATHS, viewer._index, viewer._index_loaded = saved
+    print("✅ viewer lookup: newest database hit, solver fallback on a miss")
+
 def run_performance_test():
     """Run a simple performance test to estimate time for full solve"""
     solver = CalendarPuzzleSolver()
@@ -107,6 +474,23 @@ if __name__ == "__main__":
     print("Calendar Puzzle Solver - Test Script")
     print("=" * 50)
     
+    # Fast solver regression checks (about four minutes) before the brute-force runs
+    print("Checking fast solver configurations...")
+    test_fast_solver_variants()
+    test_variant_effects()
+    test_dp_count_solutions()
+    test_solve_all_triples()
+    test_shared_tables()
+    test_solve_date_split()
+    test_distributed_lease()
+    test_async_solver()
+    test_dead_state_cache()
+    test_table_cache()
+    test_benchmark_registry()
+    test_solution_store_round_trip()
+    test_viewer_lookup()
+    
+    print("\n" + "=" * 50)
     # Run performance test first
     run_performance_test()
     
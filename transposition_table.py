@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+transposition_table.py – memory-bounded search memo with packed integer keys
+
+A search state ``(board_mask, used_mask)`` is packed into one int,
+``board_mask << 10 | used_mask`` (10 = number of pieces), which is far
+cheaper to hash and store than a tuple of two ints.  The table maps keys to
+values – ``True`` when it is only recording dead states, solution lists or
+counts for the DP solvers – and can be capped at a fixed number of entries:
+
+    policy "lru"    evict the least recently used entry (OrderedDict)
+    policy "clock"  second-chance eviction over a fixed slot ring; cheaper
+                    per hit than LRU, slightly less precise
+
+``capacity=None`` keeps every entry (a plain dict, nothing is evicted).
+Hits, misses and evictions are counted either way.  Evicting an entry only
+costs recomputation later, so any capacity gives correct results.
+
+``StripedTranspositionTable`` is the thread-safe variant shared by solver
+threads: keys are spread over several tables, each behind its own lock, so
+threads rarely wait on one another.
+"""
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+USED_BITS = 10          # bits reserved for the used-piece mask
+
+
+def pack_state(board_mask: int, used_mask: int, used_bits: int = USED_BITS) -> int:
+    """One int key for a (board_mask, used_mask) search state."""
+    return board_mask << used_bits | used_mask
+
+
+class TranspositionTable:
+    """Search memo keyed by packed ints, optionally bounded.
+
+    Stored values must not be None (``get`` uses None for "absent").
+    """
+
+    POLICIES = ("lru", "clock")
+
+    def __init__(self, capacity: Optional[int] = None, policy: str = "lru") -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown eviction policy {policy!r}; choose from {self.POLICIES}")
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive number of entries or None")
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept; see reset_counters)."""
+        if self.capacity is None:
+            self._entries: Dict[int, Any] = {}
+        elif self.policy == "lru":
+            self._entries = OrderedDict()
+        else:
+            # clock: key → slot, plus a ring of slot keys/values/reference bits
+            self._entries = {}
+            self._slot_keys: List[Optional[int]] = [None] * self.capacity
+            self._slot_values: List[Any] = [None] * self.capacity
+            self._referenced = bytearray(self.capacity)
+            self._hand = 0
+
+    def reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ───────────────────────────  lookups  ────────────────────────────
+    def get(self, key: int, default: Any = None) -> Any:
+        """Value stored for `key` (refreshing its recency), else `default`."""
+        entries = self._entries
+        if key not in entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if self.capacity is None:
+            return entries[key]
+        if self.policy == "lru":
+            entries.move_to_end(key)
+            return entries[key]
+        slot = entries[key]
+        self._referenced[slot] = 1
+        return self._slot_values[slot]
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ───────────────────────────  updates  ────────────────────────────
+    def put(self, key: int, value: Any) -> None:
+        """Store `value` for `key`, evicting an entry if the table is full."""
+        entries = self._entries
+        if self.capacity is None:
+            entries[key] = value
+        elif self.policy == "lru":
+            if key in entries:
+                entries.move_to_end(key)
+            elif len(entries) >= self.capacity:
+                entries.popitem(last=False)
+                self.evictions += 1
+            entries[key] = value
+        else:
+            self._clock_put(key, value)
+
+    def add(self, key: int) -> None:
+        """Record `key` as a dead state."""
+        self.put(key, True)
+
+    def _clock_put(self, key: int, value: Any) -> None:
+        entries = self._entries
+        slot = entries.get(key)
+        if slot is None:
+            if len(entries) < self.capacity:
+                slot = len(entries)
+            else:
+                # sweep the hand past recently referenced slots
+                referenced = self._referenced
+                hand = self._hand
+                while referenced[hand]:
+                    referenced[hand] = 0
+                    hand = (hand + 1) % self.capacity
+                slot = hand
+                self._hand = (hand + 1) % self.capacity
+                del entries[self._slot_keys[slot]]
+                self.evictions += 1
+            entries[key] = slot
+            self._slot_keys[slot] = key
+        self._slot_values[slot] = value
+        self._referenced[slot] = 1
+
+    # ───────────────────────────  reporting  ──────────────────────────
+    def counters(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "capacity": self.capacity,
+                "policy": self.policy, "hits": self.hits, "misses": self.misses,
+                "evictions": self.evictions}
+
+    def __repr__(self) -> str:
+        return (f"TranspositionTable({len(self._entries)}/{self.capacity} {self.policy}, "
+                f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions)")
+
+
+class StripedTranspositionTable:
+    """TranspositionTable safe to share between threads.
+
+    Keys are hashed onto `stripes` independent tables, each guarded by its
+    own lock; `capacity` (if any) is split evenly between them.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, policy: str = "lru",
+                 stripes: int = 16) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1")
+        per_stripe = None if capacity is None else max(1, capacity // stripes)
+        self.capacity = capacity
+        self.policy = policy
+        self.stripes = stripes
+        self._tables = [TranspositionTable(per_stripe, policy) for _ in range(stripes)]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, key: int) -> int:
+        # the low bits are the used-piece mask, shared by many states: mix first
+        return ((key * 0x9E3779B97F4A7C15) >> 40) % self.stripes
+
+    def get(self, key: int, default: Any = None) -> Any:
+        i = self._stripe(key)
+        with self._locks[i]:
+            return self._tables[i].get(key, default)
+
+    def __contains__(self, key: int) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables)
+
+    def put(self, key: int, value: Any) -> None:
+        i = self._stripe(key)
+        with self._locks[i]:
+            self._tables[i].put(key, value)
+
+    def add(self, key: int) -> None:
+        """Record `key` as a dead state."""
+        self.put(key, True)
+
+    def clear(self) -> None:
+        for lock, table in zip(self._locks, self._tables):
+            with lock:
+                table.clear()
+
+    def reset_counters(self) -> None:
+        for table in self._tables:
+            table.reset_counters()
+
+    def counters(self) -> Dict[str, Any]:
+        return {"entries": len(self), "capacity": self.capacity, "policy": self.policy,
+                "stripes": self.stripes,
+                "hits": sum(table.hits for table in self._tables),
+                "misses": sum(table.misses for table in self._tables),
+                "evictions": sum(table.evictions for table in self._tables)}
+
+    def __repr__(self) -> str:
+        c = self.counters()
+        return (f"StripedTranspositionTable({c['entries']}/{self.capacity} {self.policy} "
+                f"×{self.stripes}, {c['hits']} hits, {c['misses']} misses, "
+                f"{c['evictions']} evictions)")
@@ -7,6 +7,7 @@ Usage (CLI):
 """
 
 from __future__ import annotations
+import json
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,14 @@ from pathlib import Path
 # import the solver you already have
 # adjust the path / name if you placed the file elsewhere
 from fast_dp_solver import FastCalendarPuzzleSolver
+from solution_store import SolutionStore, parse_date_key
+
+# pre-solved databases; the newest one is used (fast_dp_solver only rewrites
+# the JSON), the binary store on a tie since it is cheapest to load
+SOLUTION_DB_PATHS = (
+    Path(__file__).with_name("dp_calendar_solutions.bin"),
+    Path(__file__).with_name("dp_calendar_solutions.json"),
+)
 
 
 # ─────────────────────────  ANSI Color Codes  ──────────────────────────
@@ -71,7 +80,9 @@ _SYM = "ABCDEFGHIJ"        # one symbol per piece (10 total)
 
 
 # ─────────────────────────  pretty printer  ──────────────────────────
-def _render(board_state: list[list[int]], solver: FastCalendarPuzzleSolver, colorize: bool = True) -> str:
+def _render(board_state: list[list[int]],
+            solver: FastCalendarPuzzleSolver | type[FastCalendarPuzzleSolver],
+            colorize: bool = True) -> str:
     """Render board with optional colorization"""
     out_lines: list[str] = []
     
@@ -144,8 +155,68 @@ def _render_piece_legend() -> str:
     return "\n".join(lines)
 
 
+# ─────────────────────────  solution index  ──────────────────────────
+class _SolutionIndex:
+    """(day, month, weekday) → boards, loaded once per process."""
+
+    def __init__(self, path: Path) -> None:
+        self._store: SolutionStore | None = None
+        self._boards: dict[tuple[int, int, int], list] = {}
+        if path.suffix == ".bin":
+            self._store = SolutionStore.load(str(path))
+        else:
+            with open(path, encoding="utf-8") as fh:
+                raw = json.load(fh)
+            self._boards = {parse_date_key(key): [e["board_state"] for e in entries]
+                            for key, entries in raw.items()}
+
+    def get(self, key: tuple[int, int, int]) -> list:
+        if self._store is not None:
+            return self._store.boards(*key)
+        return self._boards.get(key, [])
+
+
+_index: _SolutionIndex | None = None
+_index_loaded = False
+_fallback_solver: FastCalendarPuzzleSolver | None = None
+
+
+def _solution_index() -> _SolutionIndex | None:
+    """Open the newest readable database in SOLUTION_DB_PATHS (cached)."""
+    global _index, _index_loaded
+    if not _index_loaded:
+        _index_loaded = True
+        found = [(path.stat().st_mtime, -rank, path)
+                 for rank, path in enumerate(SOLUTION_DB_PATHS) if path.exists()]
+        for _, _, path in sorted(found, reverse=True):
+            try:
+                _index = _SolutionIndex(path)
+                break
+            except (OSError, ValueError):
+                continue
+    return _index
+
+
+def _solutions_for(date: datetime, use_index: bool = True) -> list:
+    """Boards for `date`: served from the index, solved only on a miss."""
+    global _fallback_solver
+    key = (date.day, date.month, date.weekday() + 1)
+
+    if use_index:
+        index = _solution_index()
+        if index is not None:
+            sols = index.get(key)
+            if sols:
+                return sols
+
+    if _fallback_solver is None:
+        _fallback_solver = FastCalendarPuzzleSolver()
+    return _fallback_solver.solve_for_date(*key)
+
+
 # ────────────────────────  public convenience  ───────────────────────
-def print_solution_for_date(date: datetime | str, colorize: bool = True, show_legend: bool = True) -> None:
+def print_solution_for_date(date: datetime | str, colorize: bool = True, show_legend: bool = True,
+                            use_index: bool = True) -> None:
     """
     Solve and pretty-print the puzzle for `date`.
 
@@ -156,32 +227,33 @@ def print_solution_for_date(date: datetime | str, colorize: bool = True, show_le
         date: The date to solve for
         colorize: Whether to use colored output (default: True)
         show_legend: Whether to show the piece legend (default: True)
+        use_index: Look the date up in the pre-solved database first and
+            only run the solver on a miss (default: True)
     """
     if isinstance(date, str):
         date = datetime.fromisoformat(date)
 
-    solver = FastCalendarPuzzleSolver()
-    sols = solver.solve_for_date(date.day, date.month, date.weekday() + 1)
+    sols = _solutions_for(date, use_index)
 
     if not sols:
         print("❌  No solution for that date.")
         return
 
     # Print the solution
-    print(_render(sols[0], solver, colorize))
+    print(_render(sols[0], FastCalendarPuzzleSolver, colorize))
     
     # Optionally print separate legend
     if colorize and show_legend:
         print(_render_piece_legend())
 
 
-def print_multiple_solutions(date: datetime | str, max_solutions: int = 3, colorize: bool = True) -> None:
+def print_multiple_solutions(date: datetime | str, max_solutions: int = 3, colorize: bool = True,
+                             use_index: bool = True) -> None:
     """Print multiple solutions for a date if available"""
     if isinstance(date, str):
         date = datetime.fromisoformat(date)
 
-    solver = FastCalendarPuzzleSolver()
-    sols = solver.solve_for_date(date.day, date.month, date.weekday() + 1)
+    sols = _solutions_for(date, use_index)
 
     if not sols:
         print("❌  No solution for that date.")
@@ -192,7 +264,7 @@ def print_multiple_solutions(date: datetime | str, max_solutions: int = 3, color
     # Show up to max_solutions
     for i, solution in enumerate(sols[:max_solutions]):
         print(f"\n📋 Solution {i + 1}:")
-        print(_render(solution, solver, colorize))
+        print(_render(solution, FastCalendarPuzzleSolver, colorize))
         
         if i == 0 and colorize:  # Show legend only for first solution
             print(_render_piece_legend())
@@ -212,6 +284,7 @@ def _main(argv: list[str]) -> None:
         print(f"  --no-color     Disable colored output")
         print(f"  --no-legend    Hide piece legend")
         print(f"  --multiple N   Show up to N solutions (default: 1)")
+        print(f"  --solve        Always solve instead of reading the solution database")
         print(f"  -h, --help     Show this help message")
         sys.exit(1)
 
@@ -219,6 +292,7 @@ def _main(argv: list[str]) -> None:
     date_str = argv[1]
     colorize = "--no-color" not in argv
     show_legend = "--no-legend" not in argv
+    use_index = "--solve" not in argv
     multiple = False
     max_solutions = 1
     
@@ -241,9 +315,9 @@ def _main(argv: list[str]) -> None:
 
     # Print solution(s)
     if multiple:
-        print_multiple_solutions(date, max_solutions, colorize)
+        print_multiple_solutions(date, max_solutions, colorize, use_index)
     else:
-        print_solution_for_date(date, colorize, show_legend)
+        print_solution_for_date(date, colorize, show_legend, use_index)
 
 
 if __name__ == "__main__":